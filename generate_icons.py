@@ -105,6 +105,7 @@ def generate_android_icons():
     try:
         # Try to use PIL to create the icon
         from PIL import Image
+        from icon_engine.masks import apply_mask
         
         # Create the base icon
         base_icon = create_icon_with_pil()
@@ -122,17 +123,8 @@ def generate_android_icons():
             # Also create round icon
             round_icon_path = os.path.join(folder_path, 'ic_launcher_round.png')
             
-            # Create round version
-            round_icon = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            
-            # Create circular mask
-            mask = Image.new('L', (size, size), 0)
-            mask_draw = ImageDraw.Draw(mask)
-            mask_draw.ellipse([0, 0, size, size], fill=255)
-            
-            # Apply mask to resized icon
-            round_icon.paste(resized_icon, (0, 0))
-            round_icon.putalpha(mask)
+            # Create round version with the cached anti-aliased circle mask
+            round_icon = apply_mask(resized_icon, 'circle')
             round_icon.save(round_icon_path, 'PNG')
             
             print(f"Created {icon_path} ({size}x{size})")
@@ -141,14 +133,15 @@ def generate_android_icons():
         print("✅ All Android icons generated successfully!")
         return True
         
-    except ImportError:
-        print("❌ PIL (Pillow) not installed. Installing...")
+    except ImportError as e:
+        # The mask library needs NumPy as well as Pillow; name whichever is missing
+        package = 'Pillow' if e.name in (None, 'PIL') else e.name
+        print(f"❌ {package} not installed.")
+        print(f"Please install {package}: pip install {package}")
         return False
 
 if __name__ == "__main__":
     try:
-        success = generate_android_icons()
-        if not success:
-            print("Please install Pillow: pip install Pillow")
+        generate_android_icons()
     except Exception as e:
         print(f"Error generating icons: {e}")
\ No newline at end of file
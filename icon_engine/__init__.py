@@ -0,0 +1,6 @@
+"""Shared icon rendering engine for the Mini Habit Tracker launcher icons.
+
+Every checkmark variant is described by a design spec in ``designs.py`` and
+rendered by the single engine in ``engine.py``. Importing this package is
+cheap: Pillow is only imported once something is actually drawn.
+"""
@@ -0,0 +1,99 @@
+"""Android adaptive icon layers (API 26+).
+
+An adaptive icon is two 108dp layers that the launcher masks into its own
+shape. The background layer is the design's green fill, full-bleed. The
+foreground layer is the checkmark and dots, scaled so the design's circle
+fills the 66dp safe zone in the middle of the canvas, which no launcher
+mask ever crops.
+
+The background depends only on the background color, so it is rendered
+once per density and reused by every variant, and its cache key ignores
+the rest of the design.
+"""
+
+import os
+from functools import lru_cache
+
+from .designs import get_design
+from .engine import render_icon
+from .paint import bind, gradient_image, is_gradient, resolve
+
+CANVAS_DP = 108
+SAFE_ZONE_DP = 66
+
+DENSITY_SCALES = {
+    'mdpi': 1.0,
+    'hdpi': 1.5,
+    'xhdpi': 2.0,
+    'xxhdpi': 3.0,
+    'xxxhdpi': 4.0,
+}
+
+ANYDPI_DIR = 'mipmap-anydpi-v26'
+
+ADAPTIVE_ICON_XML = '''<?xml version="1.0" encoding="utf-8"?>
+<adaptive-icon xmlns:android="http://schemas.android.com/apk/res/android">
+    <background android:drawable="@mipmap/ic_launcher_background" />
+    <foreground android:drawable="@mipmap/ic_launcher_foreground" />
+</adaptive-icon>
+'''
+
+
+def layer_size(density):
+    return int(round(CANVAS_DP * DENSITY_SCALES[density]))
+
+
+@lru_cache(maxsize=None)
+def _background_layer(paint, size):
+    from PIL import Image
+
+    if is_gradient(paint):
+        # Full-bleed: the gradient spans the whole layer
+        return gradient_image(bind(paint, (0, 0, size, size)), (0, 0, size, size))
+    return Image.new('RGBA', (size, size), paint)
+
+
+def render_layer(design, size, layer, backend='pillow'):
+    """Render the 'background' or 'foreground' layer of a design"""
+    from PIL import Image
+
+    if isinstance(design, str):
+        design = get_design(design)
+
+    if layer == 'background':
+        return _background_layer(resolve(design['background']), size).copy()
+
+    # Size the design so its background circle spans the safe zone
+    circle_fraction = 1 - 2 * design['margin']
+    inner = int(round(size * SAFE_ZONE_DP / CANVAS_DP / circle_fraction))
+    foreground = render_icon(dict(design, background=None), inner, backend)
+
+    canvas = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    offset = (size - inner) // 2
+    canvas.paste(foreground, (offset, offset))
+    return canvas
+
+
+def adaptive_outputs(design, base_path):
+    """Foreground and background layer outputs for every density"""
+    outputs = []
+    for density in DENSITY_SCALES:
+        folder_path = f"{base_path}/mipmap-{density}"
+        for layer in ('background', 'foreground'):
+            outputs.append({
+                'name': f"{density}-{layer}",
+                'design': design,
+                'size': layer_size(density),
+                'paths': [f"{folder_path}/ic_launcher_{layer}.png"],
+                'layer': layer,
+            })
+    return outputs
+
+
+def write_adaptive_xml(base_path):
+    """Write mipmap-anydpi-v26/ic_launcher.xml and ic_launcher_round.xml"""
+    folder_path = os.path.join(base_path, ANYDPI_DIR)
+    os.makedirs(folder_path, exist_ok=True)
+    for name in ('ic_launcher.xml', 'ic_launcher_round.xml'):
+        with open(os.path.join(folder_path, name), 'w') as f:
+            f.write(ADAPTIVE_ICON_XML)
@@ -0,0 +1,63 @@
+"""Reusable scratch buffers for the rasterizers.
+
+Rendering a multi-size output set used to allocate a fresh float canvas,
+coverage and color arrays and a gradient mask for every size, and throw
+them away again. An ``Arena`` keeps one flat buffer per purpose, grown to
+the largest size requested so far, and hands out views of it shaped for the
+current size: once the largest output has been rendered, every smaller one
+draws into memory that is already mapped, and peak memory stays at what the
+largest size needs instead of creeping up with fragmentation.
+
+Arenas are per thread (``local_arena``), since the listing and screenshot
+pools render on several threads at once. A view is only valid until the
+same buffer is taken again, so anything that leaves the renderer (an image
+handed to the encoder) must be a copy.
+"""
+
+import math
+import threading
+
+import numpy as np
+
+_local = threading.local()
+
+
+class Arena:
+    """Grow-only scratch buffers, handed out as shaped views"""
+
+    def __init__(self):
+        self._buffers = {}
+        self._images = {}
+
+    def take(self, name, shape, dtype=np.float32, zero=False):
+        """View of buffer ``name`` with ``shape``, zero-filled with ``zero``"""
+        dtype = np.dtype(dtype)
+        count = math.prod(shape)
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype or buffer.size < count:
+            buffer = self._buffers[name] = np.empty(count, dtype)
+        view = buffer[:count].reshape(shape)
+        if zero:
+            view.fill(0)
+        return view
+
+    def image(self, name, mode, size):
+        """Blank Pillow image of at least size x size.
+
+        Pillow cannot draw into a view, so the image is only ever grown;
+        callers clear the part they drew on before giving it back.
+        """
+        from PIL import Image
+
+        img = self._images.get(name)
+        if img is None or img.mode != mode or img.width < size:
+            img = self._images[name] = Image.new(mode, (size, size), 0)
+        return img
+
+
+def local_arena():
+    """The calling thread's arena"""
+    arena = getattr(_local, 'arena', None)
+    if arena is None:
+        arena = _local.arena = Arena()
+    return arena
@@ -0,0 +1,60 @@
+"""Batched variant rendering into one stacked array and a contact sheet.
+
+``render_batch`` renders N designs at M sizes into a single uint8 buffer of
+shape ``(N, M, H, W, 4)``, where ``H = W`` is the largest requested size.
+Smaller sizes sit in the top-left corner of their cell and the rest of the
+cell stays transparent. ``contact_sheet`` lays that buffer out as one
+labelled review image.
+"""
+
+import numpy as np
+
+from .designs import get_design
+from .engine import layout, render_icon
+
+LABEL_HEIGHT = 18
+CELL_PADDING = 8
+
+
+def render_batch(designs, sizes, backend='sdf'):
+    """Render every design at every size into an (N, M, H, W, 4) buffer"""
+    specs = [get_design(d) if isinstance(d, str) else d for d in designs]
+    extent = max(sizes)
+    buffer = np.zeros((len(specs), len(sizes), extent, extent, 4), dtype=np.uint8)
+
+    for m, size in enumerate(sizes):
+        if backend == 'sdf':
+            from . import sdf
+
+            # All variants of one size in a single array pass
+            pixels = sdf.render_layouts([layout(spec, size) for spec in specs], size)
+            buffer[:, m, :size, :size] = pixels
+        else:
+            for n, spec in enumerate(specs):
+                buffer[n, m, :size, :size] = np.asarray(render_icon(spec, size, backend))
+    return buffer
+
+
+def contact_sheet(buffer, labels, sizes, background=(255, 255, 255, 255)):
+    """Lay out a render_batch buffer as one labelled image.
+
+    One row per design, one column per size; every cell is labelled with
+    the design name and the pixel size.
+    """
+    from PIL import Image, ImageDraw
+
+    rows, columns, extent = buffer.shape[0], buffer.shape[1], buffer.shape[2]
+    cell_w = extent + 2 * CELL_PADDING
+    cell_h = extent + 2 * CELL_PADDING + LABEL_HEIGHT
+
+    sheet = Image.new('RGBA', (columns * cell_w, rows * cell_h), background)
+    draw = ImageDraw.Draw(sheet)
+    for n in range(rows):
+        for m in range(columns):
+            size = sizes[m]
+            x = m * cell_w + CELL_PADDING
+            y = n * cell_h + CELL_PADDING
+            tile = Image.fromarray(buffer[n, m, :size, :size], 'RGBA')
+            sheet.alpha_composite(tile, (x, y))
+            draw.text((x, y + extent + 2), f"{labels[n]} {size}px", fill=(33, 33, 33, 255))
+    return sheet
@@ -0,0 +1,170 @@
+"""Icon pipeline benchmark suite with baseline regression gating.
+
+Measures render time per backend, design and size, PNG encode time, a full
+build of every Android and store output, pixels per second and the peak
+RSS of the whole run (a process high-water mark, so it is not reported per
+case). Results are written as JSON and compared against a stored baseline; any
+case that got slower than the configured threshold makes the run exit
+non-zero, so renderer slowdowns are caught before a release build.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+
+from .memory import format_mb, peak_rss_mb
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'bench_baseline.json')
+
+DEFAULT_SIZES = (48, 192, 512, 1024, 4096)
+DEFAULT_THRESHOLD = 0.25
+
+# Slowdowns smaller than this are timer noise, whatever the ratio
+MIN_DELTA_SECONDS = 0.002
+
+
+def _best_time(func, repeats):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _repeats(size):
+    # Large masters are slow enough that one run is a stable measurement
+    if size <= 512:
+        return 5
+    return 3 if size <= 1024 else 1
+
+
+def _record(results, case, seconds, pixels=None):
+    entry = {'seconds': round(seconds, 6)}
+    if pixels:
+        entry['pixels_per_second'] = round(pixels / seconds) if seconds else None
+    results[case] = entry
+    print(f"  {case:<44} {seconds * 1000:>10.2f} ms")
+
+
+def bench_render(results, backends, designs, sizes):
+    from .engine import render_icon
+
+    for backend in backends:
+        for design in designs:
+            for size in sizes:
+                seconds = _best_time(lambda: render_icon(design, size, backend), _repeats(size))
+                _record(results, f"render/{backend}/{design}/{size}", seconds, size * size)
+
+
+def bench_encode(results, backends, sizes):
+    from .build import ENCODER_SETTINGS
+    from .encode import encode_png
+    from .engine import render_icon
+
+    for backend in backends:
+        for size in sizes:
+            icon = render_icon('final_rounded', size, backend)
+            seconds = _best_time(lambda: encode_png(icon, ENCODER_SETTINGS), _repeats(size))
+            _record(results, f"encode/{backend}/{size}", seconds, size * size)
+
+
+def bench_build(results, backends, jobs):
+    """Full Android + store build into a scratch directory, without cache"""
+    from .build import android_outputs, run_outputs, store_outputs
+
+    for backend in backends:
+        with tempfile.TemporaryDirectory() as scratch:
+            outputs = android_outputs('final_rounded') + store_outputs('final_rounded')
+            for output in outputs:
+                output['paths'] = [os.path.join(scratch, p) for p in output['paths']]
+                output['masks'] = {os.path.join(scratch, p): shape
+                                   for p, shape in output.get('masks', {}).items()}
+            with contextlib.redirect_stdout(io.StringIO()):
+                seconds = run_outputs(outputs, jobs=jobs, backend=backend)
+        _record(results, f"build/{backend}/jobs{jobs}", seconds)
+
+
+def run_suite(backends, designs, sizes, encode_sizes=(512, 1024), jobs=1):
+    import numpy
+    import PIL
+
+    results = {}
+    print("⏱️  Running icon pipeline benchmarks...")
+    bench_render(results, backends, designs, sizes)
+    bench_encode(results, backends, encode_sizes)
+    bench_build(results, backends, jobs)
+    peak = peak_rss_mb()
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'pillow': PIL.__version__,
+            'numpy': numpy.__version__,
+            'machine': platform.machine(),
+            'system': platform.system(),
+        },
+        'peak_rss_mb': peak and round(peak, 1),
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return (case, baseline, current, unit) of every regression.
+
+    A case regresses when it is slower than the baseline by more than
+    ``threshold`` and by more than MIN_DELTA_SECONDS; peak RSS of the whole
+    run is gated by the same relative threshold.
+    """
+    regressions = []
+    for case, current in report['results'].items():
+        previous = baseline.get('results', {}).get(case)
+        if not previous:
+            continue
+        before, after = previous['seconds'], current['seconds']
+        if after > before * (1 + threshold) and after - before > MIN_DELTA_SECONDS:
+            regressions.append((case, before * 1000, after * 1000, 'ms'))
+
+    before_rss, after_rss = baseline.get('peak_rss_mb'), report['peak_rss_mb']
+    if before_rss and after_rss and after_rss > before_rss * (1 + threshold):
+        regressions.append(('peak_rss', before_rss, after_rss, 'MiB'))
+    return regressions
+
+
+def main(args):
+    """Run the suite, write JSON and gate on the baseline; returns exit code"""
+    from .designs import DESIGNS
+
+    baseline_path = args.baseline or BASELINE_PATH
+    report = run_suite(args.backends, args.designs or list(DESIGNS), args.sizes, jobs=args.jobs)
+    print(f"  Peak RSS: {format_mb(report['peak_rss_mb'])}")
+
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"📄 Results written to {args.out}")
+
+    if args.save_baseline:
+        with open(baseline_path, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"📌 Baseline saved to {baseline_path}")
+        return 0
+
+    if not os.path.exists(baseline_path):
+        print(f"ℹ️  No baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    if not regressions:
+        print(f"✅ No case slower than baseline by more than {args.threshold:.0%}")
+        return 0
+
+    print(f"❌ {len(regressions)} case(s) slower than baseline by more than {args.threshold:.0%}:")
+    for case, before, after, unit in regressions:
+        print(f"   {case}: {before:.2f} {unit} → {after:.2f} {unit} ({after / before:.2f}x)")
+    return 1
@@ -0,0 +1,305 @@
+"""Plan and render the icon outputs written into the app and store assets.
+
+An output is a dict naming the design, the pixel size and every path the
+rendered image is saved to. An optional ``masks`` dict maps some of those
+paths to a mask shape from ``masks.py`` (e.g. the round launcher icon), and
+``opaque`` gives an RGB color to flatten the icon onto (iOS icons must not
+have an alpha channel). ``layer`` renders one adaptive icon layer instead
+of the whole icon (see ``adaptive.py``). Outputs are independent of each
+other, so ``run_outputs`` can spread them across a process pool.
+
+Three render modes are supported: "exact" redraws the design at every output
+size, "fast" draws one supersampled master per design and takes every size
+from its downscale pyramid (see ``pyramid.py``), and "vector" rasterizes
+every size from the design's SVG master (see ``svg.py``).
+"""
+
+import time
+
+from . import trace
+from .pyramid import MASTER_SIZE
+
+# Icon sizes for different densities
+ANDROID_DENSITIES = {
+    'mdpi': 48,
+    'hdpi': 72,
+    'xhdpi': 96,
+    'xxhdpi': 144,
+    'xxxhdpi': 192,
+}
+
+ANDROID_RES = 'android/app/src/main/res'
+
+RENDER_MODES = ('exact', 'fast', 'vector')
+
+# Output groups the full build can produce
+TARGETS = ('android', 'adaptive', 'store', 'ios')
+# Targets whose PNGs are committed, and so what 'verify' checks by default
+COMMITTED_TARGETS = ('android', 'store')
+
+# PNG encode stage settings (see encode.py); part of every cache key
+ENCODER_SETTINGS = {
+    'compress_level': 9,
+    'strategies': ['default', 'filtered', 'rle'],
+    'palette': True,
+    'strip_metadata': True,
+}
+
+
+def android_outputs(design, base_path=ANDROID_RES):
+    """Regular and round launcher icons for every density"""
+    outputs = []
+    for density, size in ANDROID_DENSITIES.items():
+        folder_path = f"{base_path}/mipmap-{density}"
+        round_path = f"{folder_path}/ic_launcher_round.png"
+        outputs.append({
+            'name': density,
+            'design': design,
+            'size': size,
+            'paths': [f"{folder_path}/ic_launcher.png", round_path],
+            'masks': {round_path: 'circle'},
+        })
+    return outputs
+
+
+def review_outputs():
+    """The 512px review PNG of every design variant"""
+    from .designs import REVIEW_OUTPUTS
+
+    return [{'name': f"review-{design}", 'design': design, 'size': 512, 'paths': [path]}
+            for design, path in REVIEW_OUTPUTS.items()]
+
+
+def store_outputs(design):
+    """Google Play Store icon and the high-resolution master"""
+    return [
+        {'name': 'play-store', 'design': design, 'size': 512,
+         'paths': ['google-play-icon-512.png']},
+        {'name': 'hires', 'design': design, 'size': 1024,
+         'paths': ['app-icon-1024.png']},
+    ]
+
+
+def plan_outputs(design, targets=TARGETS):
+    """Every output of the selected targets, without rendering anything"""
+    outputs = []
+    if 'android' in targets:
+        outputs += android_outputs(design)
+    if 'adaptive' in targets:
+        from .adaptive import adaptive_outputs
+
+        outputs += adaptive_outputs(design, ANDROID_RES)
+    if 'store' in targets:
+        outputs += store_outputs(design)
+    if 'ios' in targets:
+        from .ios import ios_outputs
+
+        outputs += ios_outputs(design)
+    return outputs
+
+
+def write_manifests(targets=TARGETS):
+    """Write the non-image files that reference the outputs"""
+    if 'adaptive' in targets:
+        from .adaptive import write_adaptive_xml
+
+        write_adaptive_xml(ANDROID_RES)
+    if 'ios' in targets:
+        from .ios import write_contents
+
+        write_contents()
+
+
+def render_images(output, icon=None, backend='pillow'):
+    """Render the final images of an output without encoding them.
+
+    Applies the adaptive layer, opaque background and per-path masks.
+    Returns ``[(paths, image)]`` with one entry per mask group.
+    """
+    from .engine import flatten, render_icon
+    from .masks import apply_mask
+
+    if icon is None and output.get('layer'):
+        from .adaptive import render_layer
+
+        icon = render_layer(output['design'], output['size'], output['layer'], backend)
+    elif icon is None:
+        icon = render_icon(output['design'], output['size'], backend)
+    if output.get('opaque'):
+        icon = flatten(icon, output['opaque'])
+
+    masks = output.get('masks', {})
+    groups = {}
+    for path in output['paths']:
+        groups.setdefault(masks.get(path), []).append(path)
+    return [(paths, apply_mask(icon, shape) if shape else icon)
+            for shape, paths in groups.items()]
+
+
+def render_output(output, icon=None, backend='pillow', encoder=None, stage=None):
+    """Render one output, encode it once per distinct image and write it.
+
+    Runs in worker processes, so it only takes and returns plain data (and
+    an already resampled image in "fast" mode). Paths that share a mask
+    share one encode; a mask that leaves the pixels unchanged (the circle
+    around an already round icon) reuses the unmasked encode. With a
+    ``stage`` token the files are written to temporary paths for an
+    ``AtomicWriter`` to commit (see ``writer.py``). Returns
+    ``(name, seconds, reports, trace_events)`` with one encode report per
+    path. ``encoder`` defaults to ENCODER_SETTINGS.
+    """
+    from .writer import stage_images
+
+    start = time.perf_counter()
+    trace.set_context(variant=output['design'], size=output['size'], output=output['name'])
+    reports = stage_images(render_images(output, icon, backend), encoder or ENCODER_SETTINGS, stage)
+    return output['name'], time.perf_counter() - start, reports, trace.collect()
+
+
+def _report(output, seconds):
+    size = output['size']
+    print(f"    ✅ {output['name']} ({size}x{size}) in {seconds * 1000:.1f} ms")
+
+
+def _pyramid_images(outputs, master_size, backend):
+    """Take every output from one pyramid per design ("fast" mode).
+
+    Adaptive icon layers are always rendered exactly. Returns
+    ``{id(output): (image, seconds)}`` with the resample time.
+    """
+    from .pyramid import from_pyramid, render_pyramid
+
+    images = {}
+    pyramids = {}
+    outputs = [output for output in outputs if not output.get('layer')]
+    for output in outputs:
+        design = output['design']
+        if design not in pyramids:
+            trace.set_context(variant=design, size=master_size, output='pyramid')
+            min_size = min(o['size'] for o in outputs if o['design'] == design)
+            pyramids[design] = render_pyramid(design, min_size, master_size, backend)
+        start = time.perf_counter()
+        image = from_pyramid(pyramids[design], output['size'])
+        images[id(output)] = (image, time.perf_counter() - start)
+    return images
+
+
+def _vector_images(outputs):
+    """Rasterize every output from one SVG master per design ("vector" mode).
+
+    Adaptive icon layers are always rendered exactly.
+    """
+    from .svg import rasterize, to_svg
+
+    images = {}
+    masters = {}
+    for output in outputs:
+        if output.get('layer'):
+            continue
+        design = output['design']
+        if design not in masters:
+            masters[design] = to_svg(design)
+        start = time.perf_counter()
+        with trace.span('svg.rasterize', size=output['size']):
+            image = rasterize(masters[design], output['size'])
+        images[id(output)] = (image, time.perf_counter() - start)
+    return images
+
+
+def run_outputs(outputs, jobs=1, mode='exact', master_size=None, cache=None,
+                backend='pillow'):
+    """Render all outputs, in parallel when ``jobs`` > 1.
+
+    Large outputs run first, so they start early in the pool and each
+    process's scratch arena is sized once by its first output; results are
+    reported as they complete so small mipmaps never wait behind them.
+    With a ``BuildCache``, outputs whose key is unchanged are skipped.
+    Every file is staged through an ``AtomicWriter`` and only moved into
+    place once all outputs succeeded; serial runs encode on the writer's
+    thread while the next output renders. Peak RSS of the run (and of the
+    largest worker) is reported at the end. Returns the total wall-clock
+    time in seconds.
+    """
+    from .memory import format_mb, peak_rss_mb
+    from .writer import AtomicWriter
+
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode '{mode}'. Use one of: {', '.join(RENDER_MODES)}")
+
+    start = time.perf_counter()
+
+    master_size = master_size or MASTER_SIZE
+    if cache is not None:
+        outputs, fresh = cache.partition(outputs, mode, ENCODER_SETTINGS, master_size, backend)
+        for output in fresh:
+            print(f"    ⏭️  {output['name']} unchanged, skipped")
+
+    images = {}
+    if mode == 'fast' and outputs:
+        images = _pyramid_images(outputs, master_size, backend)
+        print(f"  🔺 Pyramid masters ready in {(time.perf_counter() - start) * 1000:.1f} ms")
+    elif mode == 'vector' and outputs:
+        images = _vector_images(outputs)
+        print(f"  📐 Rasterized from SVG masters in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    writer = AtomicWriter(ENCODER_SETTINGS)
+
+    def job(output):
+        image, resample_seconds = images.get(id(output), (None, 0.0))
+        return (output, image, backend, ENCODER_SETTINGS, writer.token), resample_seconds
+
+    def finish(output, result, resample_seconds):
+        _, seconds, reports, events = result
+        _report(output, seconds + resample_seconds)
+        writer.add(reports)
+        trace.extend(events)
+
+    ordered = sorted(outputs, key=lambda output: output['size'], reverse=True)
+    try:
+        if jobs <= 1:
+            for output in ordered:
+                image, resample_seconds = images.get(id(output), (None, 0.0))
+                render_start = time.perf_counter()
+                trace.set_context(variant=output['design'], size=output['size'], output=output['name'])
+                writer.submit(render_images(output, image, backend), trace.context())
+                _report(output, time.perf_counter() - render_start + resample_seconds)
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            initializer = trace.enable_worker if trace.is_enabled() else None
+            with ProcessPoolExecutor(max_workers=jobs, initializer=initializer) as pool:
+                futures = {}
+                for output in ordered:
+                    args, resample_seconds = job(output)
+                    futures[pool.submit(render_output, *args)] = (output, resample_seconds)
+                for future in as_completed(futures):
+                    output, resample_seconds = futures[future]
+                    finish(output, future.result(), resample_seconds)
+        encode_reports = writer.commit()
+    except BaseException:
+        writer.abort(path for output in outputs for path in output['paths'])
+        print("  ↩️  Run stopped before commit; no outputs were changed")
+        raise
+
+    if cache is not None:
+        for output in outputs:
+            cache.record(output)
+
+    if encode_reports:
+        from .encode import print_report
+
+        print("  🗜️  PNG encode report:")
+        print_report(encode_reports)
+
+    if cache is not None:
+        cache.save()
+        print(f"  {cache.summary()}")
+
+    rss = f"  🧠 Peak RSS: {format_mb(peak_rss_mb())}"
+    if jobs > 1:
+        rss += f" (largest worker {format_mb(peak_rss_mb(children=True))})"
+    print(rss)
+
+    total = time.perf_counter() - start
+    print(f"  ⏱️  {len(outputs)} outputs in {total * 1000:.1f} ms (jobs={jobs}, mode={mode}, backend={backend})")
+    return total
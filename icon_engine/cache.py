@@ -0,0 +1,102 @@
+"""Content-addressed incremental build cache for generated icons.
+
+Every output gets a key hashed from everything that affects its bytes: the
+design's compiled display list (so palette colors and gradient stops are
+hashed, not just their names), the pixel size, the render mode, the
+rasterizer backend, the renderer version and the encoder settings. The
+manifest remembers the key and the file digest last written to each path,
+so an output is only rendered again when its key changes or the file on
+disk no longer matches what was written.
+"""
+
+import hashlib
+import json
+import os
+
+from .designs import get_design
+from .display import compiled
+from .engine import RENDERER_VERSION
+from .paint import resolve
+
+MANIFEST_PATH = '.icon-cache.json'
+
+
+def output_key(output, mode='exact', encoder=None, master_size=None, backend='pillow'):
+    """Hash everything that determines the rendered bytes of an output"""
+    design = output['design']
+    if output.get('layer') == 'background':
+        # The background layer is the same for every variant sharing a color
+        design = get_design(design) if isinstance(design, str) else design
+        design = {'background': resolve(design['background'])}
+    else:
+        design = compiled(design)
+    payload = {
+        'design': design,
+        'layer': output.get('layer'),
+        'size': output['size'],
+        'masks': sorted(output.get('masks', {}).items()),
+        'opaque': output.get('opaque'),
+        'mode': mode,
+        'master_size': master_size if mode == 'fast' else None,
+        'renderer': RENDERER_VERSION,
+        'backend': backend,
+        'encoder': encoder or {},
+    }
+    blob = json.dumps(payload, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(blob).hexdigest()
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class BuildCache:
+    """Manifest of output keys and file digests, keyed by output path"""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        if os.path.exists(path):
+            with open(path) as f:
+                self.entries = json.load(f).get('outputs', {})
+
+    def is_fresh(self, output, key):
+        """True if every path of the output was written with this key"""
+        for path in output['paths']:
+            entry = self.entries.get(path)
+            if not entry or entry['key'] != key or not os.path.exists(path):
+                return False
+            if file_digest(path) != entry['sha256']:
+                return False
+        return True
+
+    def partition(self, outputs, mode='exact', encoder=None, master_size=None,
+                  backend='pillow'):
+        """Split outputs into (stale, fresh) and count hits and misses"""
+        stale, fresh = [], []
+        for output in outputs:
+            key = output_key(output, mode, encoder, master_size, backend)
+            output['key'] = key
+            if self.is_fresh(output, key):
+                fresh.append(output)
+            else:
+                stale.append(output)
+        self.hits += len(fresh)
+        self.misses += len(stale)
+        return stale, fresh
+
+    def record(self, output):
+        """Remember the key and digest of a freshly written output"""
+        for path in output['paths']:
+            self.entries[path] = {'key': output['key'], 'sha256': file_digest(path)}
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump({'outputs': self.entries}, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    def summary(self):
+        return f"💾 Cache: {self.hits} hits, {self.misses} misses"
@@ -0,0 +1,387 @@
+"""Command line entry point: ``python -m icon_engine <command>``
+
+Startup is kept cheap: this module only imports argparse and the
+PIL-free planning modules. Pillow and NumPy are imported inside the
+commands that actually draw, so ``list``, ``plan`` and ``verify`` can
+run from scripts and pre-commit hooks without paying for them.
+"""
+
+import argparse
+import os
+
+from .build import COMMITTED_TARGETS, RENDER_MODES, TARGETS
+from .engine import BACKENDS
+
+
+def _targets(value):
+    targets = tuple(t.strip() for t in value.split(',') if t.strip())
+    unknown = set(targets) - set(TARGETS)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown targets: {', '.join(sorted(unknown))}")
+    return targets
+
+
+def cmd_list(args):
+    """List registered designs without loading them"""
+    from .registry import describe, design_names
+
+    for name in design_names():
+        print(f"{name:<16} {describe(name)}")
+
+
+def _planned(args):
+    from .build import ENCODER_SETTINGS, plan_outputs
+    from .cache import BuildCache
+
+    outputs = plan_outputs(args.design, args.targets)
+    cache = BuildCache()
+    stale, fresh = cache.partition(outputs, args.mode, ENCODER_SETTINGS, args.master_size,
+                                   args.backend)
+    return stale, fresh, cache
+
+
+def cmd_plan(args):
+    """Show every output a render would write and whether it is up to date"""
+    args.targets = args.targets or TARGETS
+    stale, fresh, _ = _planned(args)
+    for status, outputs in (('render', stale), ('fresh', fresh)):
+        for output in outputs:
+            size = output['size']
+            print(f"{status:<7} {output['name']:<20} {size:>5}px  {', '.join(output['paths'])}")
+    print(f"{len(stale)} to render, {len(fresh)} up to date")
+
+
+def cmd_render(args):
+    """Render every planned output for a design"""
+    args.targets = args.targets or TARGETS
+    from . import trace
+    from .build import plan_outputs, run_outputs, write_manifests
+    from .cache import BuildCache
+
+    if args.trace:
+        trace.enable()
+    cache = None if args.force else BuildCache()
+    run_outputs(plan_outputs(args.design, args.targets), jobs=args.jobs, mode=args.mode,
+                master_size=args.master_size, cache=cache, backend=args.backend)
+    write_manifests(args.targets)
+    if args.trace:
+        trace.write(args.trace)
+        print(f"  🔍 Trace written to {args.trace}")
+
+
+def _verify_images(args):
+    """Compare fresh renders of every output with the committed goldens"""
+    from .build import plan_outputs, review_outputs
+    from .golden import verify_goldens
+
+    outputs = plan_outputs(args.design, args.targets) + review_outputs()
+    results = verify_goldens(outputs, args.backend, args.tolerance, args.diff_dir, args.jobs)
+
+    failed = [r for r in results if r['status'] == 'fail']
+    missing = [r for r in results if r['status'] == 'missing']
+    for r in results:
+        if r['status'] == 'missing':
+            print(f"⚪ {r['path']}: no golden committed")
+        elif 'reason' in r:
+            print(f"❌ {r['path']}: {r['reason']}")
+        else:
+            mark = '✅' if r['status'] == 'ok' else '❌'
+            print(f"{mark} {r['path']}: max {r['max_delta']}, mean {r['mean_delta']:.3f}, "
+                  f"ssim {r['ssim']:.4f}, phash {r['phash']}"
+                  + (f" → {r['diff']}" if r.get('diff') else ''))
+    checked = len(results) - len(missing)
+    print(f"{checked - len(failed)}/{checked} match their goldens ({args.tolerance}), "
+          f"{len(missing)} without golden")
+    return 1 if failed else 0
+
+
+def cmd_verify(args):
+    """Exit non-zero if any planned output is missing, stale or changed"""
+    # Only these targets are committed, so only they can be checked on a clone
+    args.targets = args.targets or COMMITTED_TARGETS
+    if args.images:
+        return _verify_images(args)
+
+    stale, fresh, _ = _planned(args)
+    # The cache manifest is local and not committed: on a fresh checkout, or
+    # with files checked out over a local render, it cannot vouch for the
+    # committed files, so outputs it calls stale get an exact pixel check
+    checked = []
+    if stale and args.mode == 'exact':
+        from .golden import verify_goldens
+
+        results = verify_goldens(stale, args.backend, 'exact', None, args.jobs)
+        matching = {r['path'] for r in results if r['status'] == 'ok'}
+        checked = [o for o in stale if all(path in matching for path in o['paths'])]
+        stale = [o for o in stale if not any(o is c for c in checked)]
+
+    for output in stale:
+        print(f"❌ {output['name']}: out of date ({', '.join(output['paths'])})")
+    if stale:
+        print(f"{len(stale)} of {len(stale) + len(fresh) + len(checked)} outputs need "
+              f"'python -m icon_engine render'")
+        return 1
+    note = f" ({len(checked)} by pixel comparison)" if checked else ''
+    print(f"✅ All {len(fresh) + len(checked)} outputs are up to date{note}")
+    return 0
+
+
+def cmd_variants(args):
+    """Render every review variant in one run"""
+    from .designs import REVIEW_OUTPUTS
+    from .engine import render_variants
+
+    names = args.designs or list(REVIEW_OUTPUTS)
+    icons = render_variants(names, args.size, args.backend)
+    for name, icon in icons.items():
+        path = REVIEW_OUTPUTS.get(name, f"google-play-icon-{args.size}-{name}.png")
+        icon.save(path, 'PNG')
+        print(f"✅ {name}: saved {path}")
+
+
+def cmd_sheet(args):
+    """Render designs at several sizes into one labelled contact sheet"""
+    from .batch import contact_sheet, render_batch
+    from .designs import DESIGNS
+
+    names = args.designs or list(DESIGNS)
+    buffer = render_batch(names, args.sizes, args.backend)
+    contact_sheet(buffer, names, args.sizes).save(args.out, 'PNG')
+    print(f"✅ {len(names)} designs x {len(args.sizes)} sizes saved to {args.out}")
+
+
+def cmd_optimize(args):
+    """Losslessly re-encode existing PNGs in place and report the savings"""
+    from .encode import DEFAULT_SETTINGS, optimize_files, print_report
+
+    settings = dict(DEFAULT_SETTINGS, palette=not args.no_palette)
+    print_report(optimize_files(args.paths, settings, workers=args.jobs))
+
+
+def cmd_export(args):
+    """Render one very large PNG in tiles with bounded memory"""
+    from .memory import format_mb, peak_rss_mb
+    from .tiled import render_tiled
+
+    out = args.out or f"{args.design}-{args.size}.png"
+    result = render_tiled(args.design, args.size, out, tile=args.tile, jobs=args.jobs)
+    print(f"✅ {out}: {args.size}x{args.size} in {result['tiles']} tiles, "
+          f"{result['bytes'] / 1024:.0f} KiB, {result['seconds']:.2f}s, "
+          f"peak RSS {format_mb(peak_rss_mb(), 0)}")
+
+
+def cmd_sweep(args):
+    """Render every combination of design parameter values onto contact sheets"""
+    from .sweep import check_params, count_candidates, parse_params, run_sweep
+
+    try:
+        params = parse_params(args.params)
+        check_params(args.design, params, args.size)
+    except (KeyError, ValueError) as e:
+        raise SystemExit(e.args[0]) from None
+    fields = ', '.join(f"{field} ({len(values)})" for field, values in params.items())
+    print(f"🧪 Sweeping {count_candidates(params):,} candidates of {args.design}: {fields}")
+    result = run_sweep(args.design, params, args.size, args.out_dir, args.jobs, args.backend,
+                       args.columns, args.rows)
+    print(f"✅ {result['count']:,} candidates on {len(result['sheets'])} sheets in "
+          f"{result['seconds']:.2f}s, index: {result['index']}")
+
+
+def cmd_screenshots(args):
+    """Recompress screenshots and group near-duplicates (dry run by default)"""
+    from .encode import print_report
+    from .screenshots import default_paths, optimize_screenshots
+
+    if args.in_place and args.out:
+        raise SystemExit("Use either --in-place or --out, not both")
+    paths = args.paths or default_paths()
+    try:
+        reports, groups = optimize_screenshots(paths, args.quality, args.max_dimension,
+                                               args.out, args.in_place, args.jobs)
+    except ValueError as e:
+        raise SystemExit(e.args[0]) from None
+    print_report(reports)
+
+    sizes = {r['path']: r['after'] for r in reports}
+    for group in groups:
+        print(f"  🔁 Near-duplicates: {', '.join(group)}")
+    redundant = sum(sum(sizes[p] for p in group) - max(sizes[p] for p in group) for group in groups)
+    saved = sum(r['before'] - r['after'] for r in reports)
+    print(f"  💾 {saved:,} bytes saved by recompression, "
+          f"{redundant:,} more by keeping one screenshot per duplicate group")
+    if not (args.in_place or args.out):
+        print("  ℹ️  Dry run: pass --in-place or --out DIR to write the files")
+
+
+def cmd_listing(args):
+    """Build every Google Play listing asset on a thread pool"""
+    from .encode import print_report
+    from .listing import build_listing
+
+    reports, seconds = build_listing(args.design, args.screenshots or None, args.out_dir, args.jobs)
+    print_report(reports)
+    print(f"  ⏱️  {len(reports)} listing assets in {seconds:.2f}s")
+
+
+def cmd_svg(args):
+    """Write the SVG vector master and optionally rasterize it"""
+    from .svg import rasterize, write_svg
+
+    write_svg(args.design, args.out)
+    print(f"✅ {args.design} vector master saved to {args.out}")
+    with open(args.out) as f:
+        svg_text = f.read()
+    stem = os.path.splitext(args.out)[0]
+    for size in args.render:
+        path = f"{stem}-{size}.png"
+        rasterize(svg_text, size).save(path, 'PNG')
+        print(f"  🖼️  {path}")
+
+
+def cmd_bench(args):
+    """Benchmark the pipeline and fail on regressions against the baseline"""
+    from . import bench
+
+    return bench.main(args)
+
+
+def cmd_watch(args):
+    """Re-render outputs whenever the design spec file is saved"""
+    from .watch import watch
+
+    watch(args.spec, preview_path=args.preview, preview_size=args.size,
+          include_android=args.android, backend=args.backend)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m icon_engine',
+                                     description='Mini Habit Tracker icon pipeline')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    listing = commands.add_parser('list', help='list registered designs')
+    listing.set_defaults(func=cmd_list)
+
+    # plan, render and verify select the same outputs
+    build_options = argparse.ArgumentParser(add_help=False)
+    build_options.add_argument('--design', default='final_rounded')
+    # No default here: argparse shares a parent's actions between subparsers,
+    # so each command picks its own default targets
+    build_options.add_argument('--targets', type=_targets, default=None,
+                               help=f"comma-separated subset of {','.join(TARGETS)} "
+                                    f"(verify defaults to {','.join(COMMITTED_TARGETS)})")
+    build_options.add_argument('--mode', choices=RENDER_MODES, default='exact')
+    build_options.add_argument('--master-size', type=int, default=4096)
+    build_options.add_argument('--backend', choices=BACKENDS, default='pillow')
+
+    plan = commands.add_parser('plan', parents=[build_options],
+                               help='show outputs a render would write')
+    plan.set_defaults(func=cmd_plan)
+
+    render = commands.add_parser('render', parents=[build_options],
+                                 help='render all planned outputs')
+    render.add_argument('--jobs', '-j', type=int, default=1)
+    render.add_argument('--force', action='store_true', help='ignore the build cache')
+    render.add_argument('--trace', metavar='PATH', help='write a Chrome trace_event JSON')
+    render.set_defaults(func=cmd_render)
+
+    verify = commands.add_parser('verify', parents=[build_options],
+                                 help='fail if any planned output is missing or stale')
+    verify.add_argument('--images', action='store_true',
+                        help='render fresh and compare pixels with the committed goldens')
+    verify.add_argument('--tolerance', choices=('exact', 'visual'), default='exact')
+    verify.add_argument('--diff-dir', default='icon-diffs', help='where failing heatmaps go')
+    verify.add_argument('--jobs', '-j', type=int, default=None)
+    verify.set_defaults(func=cmd_verify)
+
+    variants = commands.add_parser('variants', help='render all review variants')
+    variants.add_argument('designs', nargs='*', help='design names (default: all review variants)')
+    variants.add_argument('--size', type=int, default=512)
+    variants.add_argument('--backend', choices=BACKENDS, default='pillow')
+    variants.set_defaults(func=cmd_variants)
+
+    sheet = commands.add_parser('sheet', help='render a contact sheet of designs and sizes')
+    sheet.add_argument('designs', nargs='*', help='design names (default: all designs)')
+    sheet.add_argument('--sizes', type=int, nargs='+', default=[48, 96, 192, 512])
+    sheet.add_argument('--backend', choices=BACKENDS, default='sdf')
+    sheet.add_argument('--out', default='icon-contact-sheet.png')
+    sheet.set_defaults(func=cmd_sheet)
+
+    optimize = commands.add_parser('optimize', help='losslessly shrink existing PNG files')
+    optimize.add_argument('paths', nargs='+')
+    optimize.add_argument('--jobs', '-j', type=int, default=None, help='encoder threads')
+    optimize.add_argument('--no-palette', action='store_true', help='keep RGBA, skip palette reduction')
+    optimize.set_defaults(func=cmd_optimize)
+
+    export = commands.add_parser('export', help='render one very large PNG in tiles')
+    export.add_argument('--design', default='final_rounded')
+    export.add_argument('--size', type=int, default=8192)
+    export.add_argument('--tile', type=int, default=1024, help='tile edge in pixels')
+    export.add_argument('--jobs', '-j', type=int, default=1)
+    export.add_argument('--out', default=None, help='output path (default: <design>-<size>.png)')
+    export.set_defaults(func=cmd_export)
+
+    sweep = commands.add_parser('sweep', help='render every combination of design parameter values')
+    sweep.add_argument('params', nargs='+', metavar='FIELD=VALUES',
+                       help='e.g. check_scale=0.4:0.8:0.1 stroke_divisor=15,18,20 caps=butt,round')
+    sweep.add_argument('--design', default='final_rounded', help='base design')
+    sweep.add_argument('--size', type=int, default=128)
+    sweep.add_argument('--backend', choices=BACKENDS, default='sdf')
+    sweep.add_argument('--jobs', '-j', type=int, default=1)
+    sweep.add_argument('--columns', type=int, default=8, help='candidates per sheet row')
+    sweep.add_argument('--rows', type=int, default=6, help='rows per sheet')
+    sweep.add_argument('--out-dir', default='design-sweep')
+    sweep.set_defaults(func=cmd_sweep)
+
+    shots = commands.add_parser('screenshots', help='shrink screenshots and find near-duplicates')
+    shots.add_argument('paths', nargs='*', help='PNG files (default: root and android screenshots)')
+    shots.add_argument('--quality', type=float, default=None, metavar='SSIM',
+                       help='allow lossy palette PNGs keeping at least this SSIM (e.g. 0.98)')
+    shots.add_argument('--max-dimension', type=int, default=None,
+                       help='downscale so the longest side is at most this many pixels')
+    shots.add_argument('--in-place', action='store_true', help='overwrite files that get smaller')
+    shots.add_argument('--out', default=None, metavar='DIR', help='write optimized copies here')
+    shots.add_argument('--jobs', '-j', type=int, default=None, help='worker threads')
+    shots.set_defaults(func=cmd_screenshots)
+
+    listing_assets = commands.add_parser('listing', help='build the Google Play listing assets')
+    listing_assets.add_argument('screenshots', nargs='*',
+                                help='phone screenshots (default: screenshot[0-9]*.png)')
+    listing_assets.add_argument('--design', default='final_rounded')
+    listing_assets.add_argument('--out-dir', default='play-store')
+    listing_assets.add_argument('--jobs', '-j', type=int, default=None, help='worker threads')
+    listing_assets.set_defaults(func=cmd_listing)
+
+    svg = commands.add_parser('svg', help='write the SVG vector master of a design')
+    svg.add_argument('--design', default='final_rounded')
+    svg.add_argument('--out', default='app_icon.svg')
+    svg.add_argument('--render', type=int, nargs='*', default=[], metavar='SIZE',
+                     help='also rasterize the master to <out>-<SIZE>.png')
+    svg.set_defaults(func=cmd_svg)
+
+    bench = commands.add_parser('bench', help='benchmark the pipeline against a stored baseline')
+    bench.add_argument('designs', nargs='*', help='design names (default: all designs)')
+    bench.add_argument('--backends', nargs='+', choices=BACKENDS, default=list(BACKENDS))
+    bench.add_argument('--sizes', type=int, nargs='+', default=[48, 192, 512, 1024, 4096])
+    bench.add_argument('--jobs', '-j', type=int, default=1, help='worker processes for the build case')
+    bench.add_argument('--out', default='icon-bench.json')
+    bench.add_argument('--baseline', default=None, help='baseline JSON (default: icon_engine/bench_baseline.json)')
+    bench.add_argument('--threshold', type=float, default=0.25,
+                       help='allowed slowdown per case before failing (0.25 = 25%%)')
+    bench.add_argument('--save-baseline', action='store_true', help='store these results as the baseline')
+    bench.set_defaults(func=cmd_bench)
+
+    watch = commands.add_parser('watch', help='re-render changed outputs on every spec save')
+    watch.add_argument('spec', nargs='?', default='icon-design.json',
+                       help='JSON design spec (created from final_rounded if missing)')
+    watch.add_argument('--preview', default='icon-preview.png')
+    watch.add_argument('--size', type=int, default=512, help='preview size')
+    watch.add_argument('--android', action='store_true', help='also update the Android mipmaps')
+    watch.add_argument('--backend', choices=BACKENDS, default='pillow')
+    watch.set_defaults(func=cmd_watch)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
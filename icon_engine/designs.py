@@ -0,0 +1,127 @@
+"""Design specs for every checkmark icon variant.
+
+A design is a plain dict of numbers and palette (or gradient) names. All
+geometry is given as fractions of the icon size (or of the checkmark size),
+so one spec can be rendered at any density by the engine.
+"""
+
+# Colors from Material Design palette
+PALETTE = {
+    'green': (76, 175, 80, 255),         # Material Design Green 500 (Basic level - background)
+    'light_green': (139, 195, 74, 255),  # Material Design Light Green 500 (for first dot)
+    'red': (244, 67, 54, 255),           # Material Design Red 500 (Good level)
+    'purple': (156, 39, 176, 255),       # Material Design Purple 500 (Excellent level)
+    'white': (255, 255, 255, 255),
+    'dark_green': (46, 125, 50, 255),    # Material Design Green 800 (gradient end)
+    'orange': (255, 107, 53, 255),       # app_icon.svg chart line start
+    'yellow': (255, 210, 63, 255),       # app_icon.svg chart line end
+}
+
+# Gradient paints, usable wherever a palette name is. Points are fractions
+# of the painted shape's bounding box: start and end for 'linear', center
+# and radius (of the larger box side) for 'radial'. Stops are evenly spaced.
+GRADIENTS = {
+    # The original app_icon.svg background, #4CAF50 to #2E7D32
+    'green_gradient': {'type': 'linear', 'points': (0.0, 0.0, 1.0, 1.0),
+                       'stops': ('green', 'dark_green')},
+    # Soft light from the top left
+    'green_glow': {'type': 'radial', 'points': (0.3, 0.3, 0.9),
+                   'stops': ('light_green', 'green', 'dark_green')},
+    # The original app_icon.svg chart line
+    'sunrise': {'type': 'linear', 'points': (0.0, 1.0, 1.0, 0.0),
+                'stops': ('orange', 'yellow')},
+}
+
+# The "final rounded" look everything else is derived from
+BASE_DESIGN = {
+    # Background circle (green for basic level)
+    'background': 'green',
+    'margin': 0.05,
+
+    # Checkmark size relative to the icon - 0.6 * 1.3 = 0.78 (30% larger)
+    'check_scale': 0.78,
+    # Left, corner and right points, relative to the center in check sizes
+    'check_points': ((-0.3, 0.0), (-0.1, 0.2), (0.35, -0.25)),
+    # Stretches the left and right points horizontally (enhanced variant)
+    'width_multiplier': 1.0,
+
+    # stroke_width = max(stroke_min, size // stroke_divisor)
+    'stroke_min': 4,
+    'stroke_divisor': 18,
+    # Red stem (good level) and purple tip (excellent level)
+    'stroke_colors': ('red', 'purple'),
+    # Ends of the checkmark: 'butt', 'round' or 'square'
+    'caps': 'butt',
+    # Corner of the checkmark, same choices; None means the same as caps
+    'join': None,
+    # Pull the red stem back under the purple tip by this fraction of the
+    # stroke width, so the whole junction is purple
+    'stem_overlap': 0.0,
+
+    # Three colored dots at the bottom to represent the 3 levels
+    'dot_radius': 0.03,
+    'dot_y': 0.85,
+    'dot_spacing': 0.08,
+    'dot_colors': ('light_green', 'red', 'purple'),
+}
+
+
+def make_design(**overrides):
+    """Return a copy of the base design with the given fields replaced"""
+    unknown = set(overrides) - set(BASE_DESIGN)
+    if unknown:
+        raise KeyError(f"Unknown design fields: {', '.join(sorted(unknown))}")
+    design = dict(BASE_DESIGN)
+    design.update(overrides)
+    return design
+
+
+DESIGNS = {
+    # update_all_icons_final.py - shipped launcher icon
+    'final_rounded': make_design(caps='round'),
+    # create_rounded_checkmark_icon.py
+    'rounded': make_design(caps='round'),
+    # create_normal_checkmark_icon.py
+    'normal': make_design(),
+    # create_refined_icon.py
+    'refined': make_design(),
+    # create_natural_checkmark_icon.py - overlap part all purple
+    'natural': make_design(stem_overlap=0.7),
+    # create_updated_icon.py - bigger, 50% wider checkmark
+    'enhanced': make_design(
+        check_points=((-0.35, 0.0), (-0.1, 0.2), (0.4, -0.25)),
+        width_multiplier=1.5,
+        stroke_divisor=15,
+        dot_spacing=0.09,
+        dot_colors=('green', 'red', 'purple'),
+    ),
+    # Final rounded look on the app_icon.svg green gradient
+    'gradient': make_design(caps='round', background='green_gradient'),
+    # update_icons.py - original three-color checkmark with white dots
+    'three_color': make_design(
+        check_scale=0.6,
+        stroke_min=3,
+        stroke_divisor=20,
+        dot_radius=0.025,
+        dot_colors=('white', 'white', 'white'),
+    ),
+}
+
+# Review files written by the individual create_*_icon.py scripts
+REVIEW_OUTPUTS = {
+    'natural': 'google-play-icon-512-natural.png',
+    'rounded': 'google-play-icon-512-rounded.png',
+    'normal': 'google-play-icon-512-normal.png',
+    'refined': 'google-play-icon-512-refined.png',
+    'enhanced': 'google-play-icon-512-enhanced.png',
+}
+
+
+def get_design(name):
+    """Look up a design spec by name, loading registered modules on demand"""
+    if name in DESIGNS:
+        return DESIGNS[name]
+
+    from .registry import load_design
+
+    return load_design(name)
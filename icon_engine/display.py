@@ -0,0 +1,164 @@
+"""Compiled, scale-independent display lists.
+
+``compile_design`` turns a design spec into a display list once: every
+coordinate and length is stored in unit terms (fractions of the icon size),
+and the size-dependent rules are written out as explicit terms instead of
+Python geometry code. ``replay`` evaluates a display list at one pixel size
+and returns the ``('ellipse', ...)`` / ``('stroke', ...)`` ops the raster
+backends draw.
+
+A display list is a tuple of plain tuples, so it is hashable, picklable and
+cheap to ship to worker processes. Its ops are
+
+* ``('disc', (x, y), radius, paint, role)``
+* ``('stroke', points, width, paints, caps, join, trim, role)``: a polyline
+  with one paint per segment, cap and join styles ('butt', 'round' or
+  'square'), painted segment by segment so later segments overlap earlier
+  ones at the joints. ``trim`` pulls each segment's end back under the next
+  segment by that many stroke widths.
+
+Paints are flat RGBA tuples or gradients in units of the shape's bounding
+box (see ``paint.py``); replay binds gradients to the shape's pixel box.
+
+Coordinates are ``(unit, centered)``: ``size * unit``, measured from the
+integer center ``size // 2`` when ``centered`` is true. Lengths are
+
+* ``('scale', u)`` - ``size * u``
+* ``('clamp', minimum, divisor)`` - ``max(minimum, size // divisor)``
+"""
+
+from functools import lru_cache
+
+from .designs import get_design
+from .paint import bind, resolve
+
+STROKE_STYLES = ('butt', 'round', 'square')
+
+
+def _style(design, field):
+    style = design[field]
+    if style not in STROKE_STYLES:
+        raise ValueError(f"Unknown {field} style '{style}'. Use {', '.join(STROKE_STYLES)}")
+    return style
+
+
+def _color_names(design, field):
+    names = design[field]
+    if isinstance(names, str):
+        raise ValueError(f"{field} takes a tuple of colors (e.g. red/purple), not '{names}'")
+    return names
+
+
+def compile_design(design):
+    """Compile a design spec into a display list.
+
+    Raises ValueError for an unknown cap or join style and for a single
+    color name where a tuple of colors is expected.
+    """
+    ops = []
+
+    # Background circle (left out for adaptive icon foreground layers)
+    if design['background'] is not None:
+        ops.append(('disc', ((0.5, False), (0.5, False)), ('scale', 0.5 - design['margin']),
+                    resolve(design['background']), 'background'))
+
+    scale = design['check_scale']
+    last = len(design['check_points']) - 1
+    points = []
+    for i, (dx, dy) in enumerate(design['check_points']):
+        # Only the two ends are stretched, the corner stays where it is
+        stretch = design['width_multiplier'] if i in (0, last) else 1
+        points.append(((scale * dx * stretch, True), (scale * dy, True)))
+    left, corner, right = points
+
+    width = ('clamp', design['stroke_min'], design['stroke_divisor'])
+    paints = tuple(resolve(name) for name in _color_names(design, 'stroke_colors'))
+    caps = _style(design, 'caps')
+    join = _style(design, 'join') if design['join'] else caps
+    ops.append(('stroke', (left, corner, right), width, paints, caps, join,
+                design['stem_overlap'], 'stroke'))
+
+    # Level dots, evenly spaced around the center
+    spacing = design['dot_spacing']
+    for offset, name in zip((-spacing, 0, spacing), _color_names(design, 'dot_colors')):
+        ops.append(('disc', ((offset, True), (design['dot_y'], False)),
+                    ('scale', design['dot_radius']), resolve(name), 'dot'))
+
+    return tuple(ops)
+
+
+@lru_cache(maxsize=64)
+def _compiled_name(name):
+    return compile_design(get_design(name))
+
+
+def compiled(design):
+    """Display list for a design name, spec dict or existing display list.
+
+    Named designs are compiled once per process.
+    """
+    if isinstance(design, tuple):
+        return design
+    if isinstance(design, str):
+        return _compiled_name(design)
+    return compile_design(design)
+
+
+def _coordinate(coordinate, size):
+    unit, centered = coordinate
+    return (size // 2 if centered else 0) + size * unit
+
+
+def _length(length, size):
+    if length[0] == 'scale':
+        return size * length[1]
+    return max(length[1], int(size // length[2]))
+
+
+@lru_cache(maxsize=256)
+def replay(display_list, size):
+    """Evaluate a display list at one size into pixel-coordinate draw ops"""
+    ops = []
+    for op in display_list:
+        if op[0] == 'disc':
+            x, y = (_coordinate(c, size) for c in op[1])
+            radius = _length(op[2], size)
+            box = (x - radius, y - radius, x + radius, y + radius)
+            ops.append(('ellipse', box, bind(op[3], box), op[4]))
+        else:
+            ops.append(_replay_stroke(op, size))
+    return tuple(ops)
+
+
+def _replay_stroke(op, size):
+    """Pixel ``('stroke', segments, width, paints, caps, join, role)`` op"""
+    _, points, width, paints, caps, join, trim, role = op
+    points = [(_coordinate(x, size), _coordinate(y, size)) for x, y in points]
+    width = _length(width, size)
+    half = width / 2
+
+    segments = []
+    bound = []
+    for i, ((x0, y0), (x1, y1)) in enumerate(zip(points, points[1:])):
+        if trim and i < len(points) - 2:
+            dx = x1 - x0
+            dy = y1 - y0
+            length = (dx**2 + dy**2)**0.5
+            ratio = (length - width * trim) / length
+            x1 = x0 + dx * ratio
+            y1 = y0 + dy * ratio
+        segments.append((x0, y0, x1, y1))
+        box = (min(x0, x1) - half, min(y0, y1) - half, max(x0, x1) + half, max(y0, y1) + half)
+        bound.append(bind(paints[i], box))
+    return ('stroke', tuple(segments), width, tuple(bound), caps, join, role)
+
+
+def stroke_segments(op):
+    """``(segment, paint, start_style, end_style)`` of every segment of a pixel stroke.
+
+    Polyline ends get the cap style, ends meeting another segment the join style.
+    """
+    segments, _, paints, caps, join = op[1:6]
+    last = len(segments) - 1
+    return [(segment, paints[i], caps if i == 0 else join, caps if i == last else join)
+            for i, segment in enumerate(segments)]
@@ -0,0 +1,145 @@
+"""PNG encoding stage: palette reduction, zlib search and metadata stripping.
+
+The icons are a handful of flat Material colors plus (with the SDF backend)
+anti-aliased edges. When an image has at most 256 distinct RGBA values it is
+stored losslessly as a palette ("P") PNG with per-entry transparency. Each
+candidate is then compressed with every configured zlib strategy and the
+smallest result wins. Pillow always picks PNG row filters itself, so the
+zlib strategy is the part of the filter/deflate search we can control.
+"""
+
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import trace
+
+# zlib strategies accepted by Pillow's ``compress_type`` save option
+ZLIB_STRATEGIES = {
+    'default': 0,
+    'filtered': 1,
+    'huffman': 2,
+    'rle': 3,
+    'fixed': 4,
+}
+
+DEFAULT_SETTINGS = {
+    'compress_level': 9,
+    'strategies': ('default', 'filtered', 'rle'),
+    'palette': True,
+    'strip_metadata': True,
+}
+
+
+def strip_metadata(img):
+    """Copy of the image without text chunks, ICC profile, EXIF or DPI"""
+    clean = img.copy()
+    clean.info = {}
+    return clean
+
+
+def to_palette(img):
+    """Lossless palette version of an RGBA image, or None if > 256 colors"""
+    from PIL import Image
+
+    pixels = np.asarray(img.convert('RGBA'))
+    packed = pixels.reshape(-1, 4).view(np.uint32).ravel()
+    colors, indices = np.unique(packed, return_inverse=True)
+    if len(colors) > 256:
+        return None
+
+    entries = colors.view(np.uint8).reshape(-1, 4)
+    palette_img = Image.fromarray(indices.astype(np.uint8).reshape(pixels.shape[:2]), 'P')
+    palette_img.putpalette(entries[:, :3].tobytes(), rawmode='RGB')
+    if (entries[:, 3] < 255).any():
+        palette_img.info['transparency'] = entries[:, 3].tobytes()
+    return palette_img
+
+
+def _save(img, **options):
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', **options)
+    return buffer.getvalue()
+
+
+def encode_png(img, settings=None):
+    """Encode an image to the smallest PNG the settings allow"""
+    settings = settings or DEFAULT_SETTINGS
+    if settings.get('strip_metadata'):
+        img = strip_metadata(img)
+
+    candidates = [img]
+    if settings.get('palette'):
+        palette_img = to_palette(img)
+        if palette_img is not None:
+            candidates.append(palette_img)
+
+    best = None
+    for candidate in candidates:
+        for name in settings.get('strategies', ('default',)):
+            data = _save(candidate,
+                         compress_level=settings.get('compress_level', 9),
+                         compress_type=ZLIB_STRATEGIES[name])
+            if best is None or len(data) < len(best):
+                best = data
+    return best
+
+
+def encode_to_file(img, path, settings=None):
+    """Encode an image and write it, returning a report dict.
+
+    ``before`` is the size of a plain ``img.save(path, 'PNG')``, which is
+    what the icon scripts wrote before this stage existed.
+    """
+    before = len(_save(img))
+    start = time.perf_counter()
+    with trace.span('png.encode', path=path):
+        data = encode_png(img, settings)
+    seconds = time.perf_counter() - start
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with trace.span('png.write', path=path), open(path, 'wb') as f:
+        f.write(data)
+    return {'path': path, 'before': before, 'after': len(data), 'seconds': seconds}
+
+
+def optimize_files(paths, settings=None, workers=None):
+    """Re-encode existing PNG files in place on a thread pool.
+
+    Pillow releases the GIL while deflating, so threads encode in parallel.
+    Files that would not get smaller are left untouched.
+    """
+    from PIL import Image
+
+    def optimize(path):
+        with open(path, 'rb') as f:
+            original = f.read()
+        start = time.perf_counter()
+        with Image.open(io.BytesIO(original)) as img:
+            img.load()
+            data = encode_png(img, settings)
+        seconds = time.perf_counter() - start
+        if len(data) < len(original):
+            with open(path, 'wb') as f:
+                f.write(data)
+        return {'path': path, 'before': len(original),
+                'after': min(len(data), len(original)), 'seconds': seconds}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(optimize, paths))
+
+
+def print_report(reports):
+    """Per-file bytes before/after and encode time, plus totals"""
+    print(f"  {'file':<62} {'before':>9} {'after':>9} {'saved':>7} {'encode':>9}")
+    for r in reports:
+        saved = 1 - r['after'] / r['before'] if r['before'] else 0.0
+        print(f"  {r['path']:<62} {r['before']:>9,} {r['after']:>9,} "
+              f"{saved:>6.1%} {r['seconds'] * 1000:>7.1f}ms")
+    before = sum(r['before'] for r in reports)
+    after = sum(r['after'] for r in reports)
+    if before:
+        print(f"  📦 Total: {before:,} → {after:,} bytes ({1 - after / before:.1%} smaller)")
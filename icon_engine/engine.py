@@ -0,0 +1,157 @@
+"""One render engine for every checkmark design.
+
+``layout`` replays a design's compiled display list into drawing primitives
+in pixel coordinates, and ``render_icon`` rasterizes them. Keeping the two
+apart means the geometry is defined once for all variants instead of being
+copied into every ``create_*_icon`` script, and lets several rasterizer
+backends share it:
+
+* ``pillow`` - ``ImageDraw`` calls, aliased, pixel-identical to the original
+  scripts and the committed icons
+* ``sdf`` - NumPy signed-distance fields with anti-aliased coverage
+  (see ``sdf.py``)
+"""
+
+from . import trace
+from .display import compiled, replay, stroke_segments
+from .paint import gradient_image, is_gradient
+
+# Bump whenever a change here alters rendered pixels, so cached outputs
+# built by an older renderer are invalidated
+RENDERER_VERSION = 2
+
+BACKENDS = ('pillow', 'sdf')
+
+
+def layout(design, size):
+    """Compute the drawing primitives for a design at one size.
+
+    ``design`` is a registered name, a spec dict or a compiled display list
+    (see ``display.py``). Returns ``('ellipse', box, paint, role)`` and
+    ``('stroke', segments, width, paints, caps, join, role)`` tuples in
+    paint order. ``role`` ("background", "stroke" or "dot") only labels the
+    primitive for profiling.
+    """
+    return replay(compiled(design), size)
+
+
+def _check_backend(backend):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Use one of: {', '.join(BACKENDS)}")
+
+
+def _pillow_shapes(op):
+    """Lower an op to ImageDraw ``(method, coordinates, paint, width)`` calls.
+
+    Pillow lines only have butt ends, so a stroke becomes one line per
+    segment (square ends extended by half the width) followed by round cap
+    and join ellipses of radius ``width // 2``: left end, right end, then
+    the corners, as the original round-cap scripts stamped them.
+    """
+    if op[0] == 'ellipse':
+        return [('ellipse', op[1], op[2], None)]
+
+    width = op[2]
+    lines = []
+    stamps = []
+    for (x0, y0, x1, y1), paint, start, end in stroke_segments(op):
+        if 'square' in (start, end):
+            length = ((x1 - x0)**2 + (y1 - y0)**2)**0.5 or 1.0
+            ux, uy = (x1 - x0) / length * width / 2, (y1 - y0) / length * width / 2
+            if start == 'square':
+                x0, y0 = x0 - ux, y0 - uy
+            if end == 'square':
+                x1, y1 = x1 + ux, y1 + uy
+        lines.append(('line', (x0, y0, x1, y1), paint, width))
+        stamps.append(((x0, y0), paint, start))
+        stamps.append(((x1, y1), paint, end))
+
+    # Caps at both polyline ends, then joins where the later segment starts
+    ends = [stamps[0], stamps[-1]] + stamps[2:-1:2]
+    radius = width // 2
+    for (x, y), paint, style in ends:
+        if style == 'round':
+            lines.append(('ellipse', (x - radius, y - radius, x + radius, y + radius), paint, None))
+    return lines
+
+
+def _draw_shape(draw, shape, fill):
+    method, coordinates, _, width = shape
+    if method == 'ellipse':
+        draw.ellipse(list(coordinates), fill=fill)
+    else:
+        draw.line(list(coordinates), fill=fill, width=width)
+
+
+def _draw_gradient(img, shape):
+    """Draw the shape as a mask, then composite the gradient through it.
+
+    The single-channel mask is the thread's arena scratch image, which may
+    be larger than img; only the part drawn on is cleared afterwards.
+    """
+    from PIL import ImageChops, ImageDraw
+
+    from .arena import local_arena
+
+    mask = local_arena().image('pillow.mask', 'L', max(img.size))
+    _draw_shape(ImageDraw.Draw(mask), shape, 255)
+    drawn = mask.getbbox()
+    if drawn is None:
+        return
+    box = (drawn[0], drawn[1], min(drawn[2], img.width), min(drawn[3], img.height))
+    if box[0] < box[2] and box[1] < box[3]:
+        layer = gradient_image(shape[2], box)
+        alpha = ImageChops.multiply(layer.getchannel('A'), mask.crop(box))
+        layer.putalpha(alpha)
+        img.alpha_composite(layer, box[:2])
+    mask.paste(0, drawn)
+
+
+def _draw_pillow(ops, size):
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for op in ops:
+        with trace.span(f"pillow.{op[-1]}", size=size):
+            for shape in _pillow_shapes(op):
+                if is_gradient(shape[2]):
+                    _draw_gradient(img, shape)
+                else:
+                    _draw_shape(draw, shape, shape[2])
+    return img
+
+
+def render_icon(design, size, backend='pillow'):
+    """Render a design name, spec or display list to an RGBA image"""
+    _check_backend(backend)
+    ops = layout(design, size)
+    if backend == 'sdf':
+        from . import sdf
+
+        return sdf.render_icon(ops, size)
+    return _draw_pillow(ops, size)
+
+
+def flatten(img, color):
+    """Composite an RGBA image onto an opaque background, returning RGB"""
+    from PIL import Image
+
+    background = Image.new('RGBA', img.size, tuple(color[:3]) + (255,))
+    return Image.alpha_composite(background, img.convert('RGBA')).convert('RGB')
+
+
+def render_variants(names, size, backend='pillow'):
+    """Render several designs at one size in a single process.
+
+    The SDF backend rasterizes all of them in one batched array pass.
+    """
+    _check_backend(backend)
+    if backend == 'sdf':
+        from PIL import Image
+
+        from . import sdf
+
+        pixels = sdf.render_layouts([layout(name, size) for name in names], size)
+        return {name: Image.fromarray(p, 'RGBA') for name, p in zip(names, pixels)}
+    return {name: render_icon(name, size) for name in names}
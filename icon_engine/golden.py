@@ -0,0 +1,155 @@
+"""Golden-image regression comparison for generated icons.
+
+Every planned output is rendered fresh, in memory, and compared with the
+PNG committed at its path. The comparison is vectorized per image: maximum
+and mean absolute channel delta, SSIM over a 7x7 window (computed with
+summed-area tables) and the Hamming distance of a 64-bit DCT perceptual
+hash. Outputs are checked in parallel across processes. Failing outputs
+get a golden | fresh | heatmap diff image.
+"""
+
+import os
+
+import numpy as np
+
+# Tolerance presets: "exact" for renderer refactors that must not change a
+# pixel, "visual" for changes that may only shift anti-aliasing slightly
+TOLERANCES = {
+    'exact': {'max_delta': 0, 'mean_delta': 0.0, 'ssim': 1.0, 'phash': 0},
+    'visual': {'max_delta': 255, 'mean_delta': 2.0, 'ssim': 0.98, 'phash': 4},
+}
+
+SSIM_WINDOW = 7
+HASH_SIZE = 32
+HEATMAP_MIN_SIZE = 256
+
+
+def _box_mean(x, k):
+    """Mean over every k x k window ('valid' region) using summed-area tables"""
+    table = np.pad(x, ((0, 0), (1, 0), (1, 0))).cumsum(axis=1).cumsum(axis=2)
+    total = table[:, k:, k:] - table[:, :-k, k:] - table[:, k:, :-k] + table[:, :-k, :-k]
+    return total / (k * k)
+
+
+def ssim(a, b, k=SSIM_WINDOW):
+    """Mean SSIM over all channels of two (H, W, C) uint8 images"""
+    if min(a.shape[:2]) < k:
+        return 1.0 if np.array_equal(a, b) else 0.0
+    x = np.moveaxis(a.astype(np.float64), -1, 0)
+    y = np.moveaxis(b.astype(np.float64), -1, 0)
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+    mx, my = _box_mean(x, k), _box_mean(y, k)
+    vx = _box_mean(x * x, k) - mx * mx
+    vy = _box_mean(y * y, k) - my * my
+    cov = _box_mean(x * y, k) - mx * my
+    index = ((2 * mx * my + c1) * (2 * cov + c2)) / ((mx * mx + my * my + c1) * (vx + vy + c2))
+    return float(index.mean())
+
+
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    matrix[0] /= np.sqrt(2.0)
+    return matrix
+
+
+_DCT = _dct_matrix(HASH_SIZE)
+
+
+def phash(img):
+    """64-bit perceptual hash: low DCT frequencies above their median"""
+    from PIL import Image
+
+    # Composite onto white so transparent areas hash consistently
+    background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+    gray = Image.alpha_composite(background, img.convert('RGBA')).convert('L')
+    pixels = np.asarray(gray.resize((HASH_SIZE, HASH_SIZE), Image.Resampling.BILINEAR),
+                        dtype=np.float64)
+    low = (_DCT @ pixels @ _DCT.T)[:8, :8].ravel()[1:]
+    return low > np.median(low)
+
+
+def compare(golden, fresh):
+    """Difference metrics between two images of the same size"""
+    a = np.asarray(golden.convert('RGBA'))
+    b = np.asarray(fresh.convert('RGBA'))
+    delta = np.abs(a.astype(np.int16) - b.astype(np.int16))
+    return {
+        'max_delta': int(delta.max()),
+        'mean_delta': float(delta.mean()),
+        'ssim': ssim(a, b),
+        'phash': int(np.count_nonzero(phash(golden) != phash(fresh))),
+    }
+
+
+def within(metrics, tolerance):
+    return (metrics['max_delta'] <= tolerance['max_delta']
+            and metrics['mean_delta'] <= tolerance['mean_delta']
+            and metrics['ssim'] >= tolerance['ssim']
+            and metrics['phash'] <= tolerance['phash'])
+
+
+def heatmap(golden, fresh):
+    """golden | fresh | heatmap strip; black = equal, red to yellow = delta"""
+    from PIL import Image
+
+    a = np.asarray(golden.convert('RGBA')).astype(np.int16)
+    b = np.asarray(fresh.convert('RGBA')).astype(np.int16)
+    delta = np.abs(a - b).max(axis=-1).astype(np.float32) / 255.0
+    heat = np.zeros(delta.shape + (3,), dtype=np.uint8)
+    heat[..., 0] = np.where(delta > 0, 128 + 127 * np.minimum(delta * 2, 1), 0)
+    heat[..., 1] = np.clip((delta - 0.5) * 2, 0, 1) * 255
+
+    width, height = golden.size
+    strip = Image.new('RGBA', (width * 3, height), (255, 255, 255, 255))
+    strip.alpha_composite(golden.convert('RGBA'), (0, 0))
+    strip.alpha_composite(fresh.convert('RGBA'), (width, 0))
+    strip.paste(Image.fromarray(heat, 'RGB'), (width * 2, 0))
+
+    # Small icons are scaled up so single-pixel differences are visible
+    scale = max(1, HEATMAP_MIN_SIZE // height)
+    if scale > 1:
+        strip = strip.resize((width * 3 * scale, height * scale), Image.Resampling.NEAREST)
+    return strip
+
+
+def check_output(output, backend, tolerance, diff_dir):
+    """Compare every path of one output with its golden; runs in workers"""
+    from PIL import Image
+
+    from .build import render_images
+
+    results = []
+    for paths, fresh in render_images(output, backend=backend):
+        for path in paths:
+            if not os.path.exists(path):
+                results.append({'path': path, 'status': 'missing'})
+                continue
+            with Image.open(path) as golden:
+                golden.load()
+            if golden.size != fresh.size:
+                results.append({'path': path, 'status': 'fail',
+                                'reason': f"size {golden.size} != {fresh.size}"})
+                continue
+            metrics = compare(golden, fresh)
+            result = dict(metrics, path=path, status='ok' if within(metrics, tolerance) else 'fail')
+            if result['status'] == 'fail' and diff_dir:
+                os.makedirs(diff_dir, exist_ok=True)
+                diff_path = os.path.join(diff_dir, path.replace(os.sep, '__'))
+                heatmap(golden, fresh).save(diff_path, 'PNG')
+                result['diff'] = diff_path
+            results.append(result)
+    return results
+
+
+def verify_goldens(outputs, backend='pillow', tolerance='exact', diff_dir='icon-diffs', jobs=None):
+    """Check all outputs against their goldens; returns every result dict"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    limits = TOLERANCES[tolerance] if isinstance(tolerance, str) else tolerance
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(check_output, output, backend, limits, diff_dir)
+                   for output in outputs]
+        return [result for future in futures for result in future.result()]
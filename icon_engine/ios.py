@@ -0,0 +1,61 @@
+"""iOS AppIcon.appiconset outputs driven by its Contents.json.
+
+Every image entry in Contents.json is a (points, scale) pair. Entries that
+resolve to the same pixel size (e.g. 40x40@3x and 60x60@2x are both 120px)
+share one rendered PNG, so each distinct size is rendered exactly once.
+``ios_outputs`` plans those renders as regular build outputs, which lets
+them run in the same job pool as the Android densities, and
+``write_contents`` points every entry at its file.
+"""
+
+import json
+import os
+
+APPICONSET = 'ios/MiniHabitTracker/Images.xcassets/AppIcon.appiconset'
+
+# App Store icons must be opaque
+IOS_BACKGROUND = (255, 255, 255)
+
+
+def _contents_path(appiconset):
+    return os.path.join(appiconset, 'Contents.json')
+
+
+def load_contents(appiconset=APPICONSET):
+    with open(_contents_path(appiconset)) as f:
+        return json.load(f)
+
+
+def pixel_size(entry):
+    """Pixel size of an entry such as {"size": "20x20", "scale": "3x"}"""
+    points = float(entry['size'].split('x')[0])
+    scale = float(entry['scale'].rstrip('x'))
+    return int(round(points * scale))
+
+
+def icon_filename(pixels):
+    return f"AppIcon-{pixels}.png"
+
+
+def ios_outputs(design, appiconset=APPICONSET):
+    """One build output per distinct pixel size in Contents.json"""
+    sizes = sorted({pixel_size(entry) for entry in load_contents(appiconset)['images']})
+    return [{
+        'name': f"ios-{pixels}",
+        'design': design,
+        'size': pixels,
+        'paths': [os.path.join(appiconset, icon_filename(pixels))],
+        'opaque': IOS_BACKGROUND,
+    } for pixels in sizes]
+
+
+def write_contents(appiconset=APPICONSET):
+    """Point every Contents.json entry at the PNG for its pixel size"""
+    contents = load_contents(appiconset)
+    for entry in contents['images']:
+        entry['filename'] = icon_filename(pixel_size(entry))
+
+    # Keep Xcode's own formatting so regenerating produces no diff noise
+    with open(_contents_path(appiconset), 'w') as f:
+        f.write(json.dumps(contents, indent=2, separators=(',', ' : '), sort_keys=True))
+        f.write('\n')
@@ -0,0 +1,137 @@
+"""Google Play Store listing assets in one run.
+
+Produces the 512px hi-res icon, a 1024x500 feature graphic drawn from the
+design spec and the phone screenshots fitted to the Play Store limits
+(16:9 to 2:1, 320-3840 px per side). Screenshots taller than 2:1 are padded
+at the sides with their average edge color instead of being cropped, so no
+UI is cut off. The icon is written as a 32-bit RGBA PNG and the feature
+graphic and screenshots are flattened to 24-bit RGB, as the store asks;
+palette reduction is turned off for all of them.
+
+Every asset is decoded, resized and encoded on a thread pool; Pillow and
+zlib release the GIL for the heavy parts, so the threads run in parallel.
+"""
+
+import glob
+import os
+import time
+
+from .build import ENCODER_SETTINGS
+
+LISTING_DIR = 'play-store'
+SCREENSHOT_GLOB = 'screenshot[0-9]*.png'
+FEATURE_SIZE = (1024, 500)
+APP_TITLE = 'Mini Habit Tracker'
+TAGLINE = 'Build better habits, one small step at a time'
+
+# Long side / short side, and pixel limits per side
+SCREENSHOT_RATIO = (16 / 9, 2.0)
+SCREENSHOT_SIDES = (320, 3840)
+
+# The store wants 32-bit and 24-bit PNGs, never palette ones
+LISTING_SETTINGS = dict(ENCODER_SETTINGS, palette=False)
+
+
+def _edge_color(img):
+    """Average color of the left and right pixel columns"""
+    import numpy as np
+
+    pixels = np.asarray(img.convert('RGB'))
+    edges = np.concatenate([pixels[:, 0], pixels[:, -1]])
+    return tuple(int(c) for c in edges.mean(axis=0).round())
+
+
+def fit_screenshot(img):
+    """Pad and scale a screenshot into the Play Store aspect and size limits"""
+    from PIL import Image
+
+    img = img.convert('RGB')
+    width, height = img.size
+    short, long = sorted(img.size)
+    min_ratio, max_ratio = SCREENSHOT_RATIO
+
+    # Pad the short side (or the long one, for very square shots)
+    if long / short > max_ratio:
+        short = -(-long // max_ratio)
+    elif long / short < min_ratio:
+        long = -(-short * min_ratio // 1)
+    target = (int(short), int(long)) if height >= width else (int(long), int(short))
+    if target != img.size:
+        canvas = Image.new('RGB', target, _edge_color(img))
+        canvas.paste(img, ((target[0] - width) // 2, (target[1] - height) // 2))
+        img = canvas
+
+    scale = min(1.0, SCREENSHOT_SIDES[1] / max(img.size))
+    scale = max(scale, SCREENSHOT_SIDES[0] / min(img.size))
+    if scale != 1.0:
+        size = tuple(round(side * scale) for side in img.size)
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    return img
+
+
+def feature_graphic(design='final_rounded', backend='sdf'):
+    """1024x500 banner: the icon on the left, title and tagline on the right"""
+    from PIL import Image, ImageDraw, ImageFont
+
+    from .designs import get_design
+    from .engine import flatten, render_icon
+    from .paint import representative, resolve
+
+    spec = get_design(design) if isinstance(design, str) else design
+    width, height = FEATURE_SIZE
+    banner = Image.new('RGBA', FEATURE_SIZE, (255, 255, 255, 255))
+    icon_size = int(height * 0.8)
+    icon = render_icon(spec, icon_size, backend)
+    banner.alpha_composite(icon, ((height - icon_size) // 2, (height - icon_size) // 2))
+
+    draw = ImageDraw.Draw(banner)
+    text_x = height
+    title_color = representative(resolve(spec['background']))
+    draw.text((text_x, height * 0.34), APP_TITLE, fill=title_color,
+              font=ImageFont.load_default(size=60))
+    draw.text((text_x, height * 0.34 + 84), TAGLINE, fill=(97, 97, 97, 255),
+              font=ImageFont.load_default(size=26))
+    return flatten(banner, (255, 255, 255))
+
+
+def listing_assets(design='final_rounded', screenshots=None, out_dir=LISTING_DIR):
+    """Plan every listing asset as ``(path, make_image)`` pairs"""
+    from .engine import render_icon
+
+    def screenshot(path):
+        def make():
+            from PIL import Image
+
+            with Image.open(path) as img:
+                return fit_screenshot(img)
+        return make
+
+    if screenshots is None:
+        screenshots = sorted(glob.glob(SCREENSHOT_GLOB))
+    assets = [
+        (os.path.join(out_dir, 'icon-512.png'), lambda: render_icon(design, 512)),
+        (os.path.join(out_dir, 'feature-graphic-1024x500.png'), lambda: feature_graphic(design)),
+    ]
+    for i, path in enumerate(screenshots, 1):
+        name = f"phone-{i}-{os.path.splitext(os.path.basename(path))[0]}.png"
+        assets.append((os.path.join(out_dir, 'screenshots', name), screenshot(path)))
+    return assets
+
+
+def build_listing(design='final_rounded', screenshots=None, out_dir=LISTING_DIR, workers=None):
+    """Render, fit and encode every listing asset on a thread pool.
+
+    Returns ``(reports, seconds)`` with one encode report per asset.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .encode import encode_to_file
+
+    def produce(asset):
+        path, make = asset
+        return encode_to_file(make(), path, LISTING_SETTINGS)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        reports = list(pool.map(produce, listing_assets(design, screenshots, out_dir)))
+    return reports, time.perf_counter() - start
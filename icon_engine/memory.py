@@ -0,0 +1,28 @@
+"""Peak memory of the running process, where the platform reports it.
+
+``resource`` only exists on POSIX systems; on Windows the peak is unknown
+and reported as "n/a" instead of breaking every command that prints it.
+"""
+
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb(children=False):
+    """Peak resident set size of this process (or its largest finished child) in MiB.
+
+    None where the platform does not report it.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB everywhere else
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def format_mb(value, digits=1):
+    return 'n/a' if value is None else f"{value:.{digits}f} MiB"
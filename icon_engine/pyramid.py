@@ -0,0 +1,47 @@
+"""Render-once supersampled master with a 2x downscale pyramid.
+
+Instead of redrawing a design for every target size, the master is drawn
+once at high resolution and halved repeatedly with a box filter. Each
+target size is then taken from the nearest pyramid level at or above it
+with a single Lanczos resample, which also anti-aliases the small icons.
+
+Size-dependent rules in the design (such as the minimum stroke width) are
+evaluated at the master size, so the "fast" pyramid result can differ
+slightly from an "exact" per-size redraw at the smallest densities.
+"""
+
+from . import trace
+from .engine import render_icon
+
+MASTER_SIZE = 4096
+
+
+def build_pyramid(master, min_size=1):
+    """Halve the master until the next level would be smaller than min_size"""
+    levels = [master]
+    while levels[-1].width // 2 >= min_size:
+        with trace.span('resize.reduce', size=levels[-1].width // 2):
+            levels.append(levels[-1].reduce(2))
+    return levels
+
+
+def render_pyramid(design, min_size=1, master_size=MASTER_SIZE, backend='pillow'):
+    """Draw the design once at master_size and build its pyramid"""
+    return build_pyramid(render_icon(design, master_size, backend), min_size)
+
+
+def from_pyramid(levels, size):
+    """Resample the nearest level at or above size down to size x size"""
+    from PIL import Image
+
+    # Levels are ordered largest first, so the last one that fits is nearest
+    source = levels[0]
+    for level in levels:
+        if level.width < size:
+            break
+        source = level
+
+    if source.width == size:
+        return source.copy()
+    with trace.span('resize.lanczos', size=size, source=source.width):
+        return source.resize((size, size), Image.Resampling.LANCZOS)
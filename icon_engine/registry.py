@@ -0,0 +1,45 @@
+"""Lazy design registry.
+
+Maps every design name to the module that defines it, plus a one-line
+description, without importing anything. A design's module is imported
+only when that design is actually selected, so commands that merely list
+or plan designs stay fast. A module defines its designs in a ``DESIGNS``
+dict; register extra modules with ``register``.
+"""
+
+import importlib
+
+BUILTIN_MODULE = 'icon_engine.designs'
+
+DESIGN_MODULES = {
+    'final_rounded': (BUILTIN_MODULE, 'Final rounded checkmark - shipped launcher icon'),
+    'rounded': (BUILTIN_MODULE, 'Rounded checkmark with round end caps'),
+    'normal': (BUILTIN_MODULE, 'Plain two-color checkmark'),
+    'refined': (BUILTIN_MODULE, 'Refined three-color checkmark, 30% larger'),
+    'natural': (BUILTIN_MODULE, 'Stem stops short so the junction is all purple'),
+    'enhanced': (BUILTIN_MODULE, 'Bigger, 50% wider checkmark with colored dots'),
+    'gradient': (BUILTIN_MODULE, 'Final rounded checkmark on a green linear gradient'),
+    'three_color': (BUILTIN_MODULE, 'Original three-color checkmark with white dots'),
+}
+
+
+def register(name, module, description=''):
+    """Make a design from another module selectable by name"""
+    DESIGN_MODULES[name] = (module, description)
+
+
+def design_names():
+    return list(DESIGN_MODULES)
+
+
+def describe(name):
+    return DESIGN_MODULES[name][1]
+
+
+def load_design(name):
+    """Import the design's module and return its spec"""
+    try:
+        module, _ = DESIGN_MODULES[name]
+    except KeyError:
+        raise KeyError(f"Unknown design '{name}'. Available: {', '.join(DESIGN_MODULES)}") from None
+    return importlib.import_module(module).DESIGNS[name]
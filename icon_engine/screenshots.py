@@ -0,0 +1,172 @@
+"""Screenshot optimizer with near-duplicate detection.
+
+Streams every screenshot through a thread pool, one decoded image per
+worker at a time: metadata is stripped, the image is optionally downscaled
+to a maximum dimension and re-encoded, either losslessly through the shared
+encode stage or, with a target quality, as a quantized palette PNG that
+keeps at least that SSIM against the original.
+
+Each worker also returns a 64-bit difference hash (dHash) computed from a
+9x8 thumbnail. The hashes are stacked into one array and compared pairwise
+in a single broadcast, and screenshots within a Hamming distance threshold
+are grouped as near-duplicates (usually iterations of the same screen).
+
+Nothing is written unless an output directory or in-place mode is chosen.
+"""
+
+import glob
+import os
+import time
+
+import numpy as np
+
+from .encode import DEFAULT_SETTINGS, encode_png
+
+SCREENSHOT_GLOBS = ('screenshot[0-9]*.png', 'android/screenshot_*.png')
+DUPLICATE_DISTANCE = 10
+PALETTE_SIZES = (64, 128, 256)
+
+
+def default_paths():
+    return sorted(path for pattern in SCREENSHOT_GLOBS for path in glob.glob(pattern))
+
+
+def dhash_bits(img):
+    """64 booleans: is each pixel of a 9x8 gray thumbnail brighter than its left neighbour"""
+    from PIL import Image
+
+    thumb = np.asarray(img.convert('L').resize((9, 8), Image.Resampling.BOX), dtype=np.int16)
+    return (thumb[:, 1:] > thumb[:, :-1]).ravel()
+
+
+def hamming_matrix(hashes):
+    """Pairwise Hamming distances of an (N, 64) boolean hash array"""
+    return (hashes[:, None, :] != hashes[None, :, :]).sum(axis=-1)
+
+
+def duplicate_groups(paths, hashes, max_distance=DUPLICATE_DISTANCE):
+    """Group paths whose hashes are within max_distance of each other"""
+    distances = hamming_matrix(np.asarray(hashes))
+    parent = list(range(len(paths)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in zip(*np.nonzero(np.triu(distances <= max_distance, k=1))):
+        parent[root(i)] = root(j)
+
+    groups = {}
+    for i, path in enumerate(paths):
+        groups.setdefault(root(i), []).append(path)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def downscale(img, max_dimension):
+    from PIL import Image
+
+    scale = max_dimension / max(img.size)
+    if scale >= 1:
+        return img
+    size = tuple(max(1, round(side * scale)) for side in img.size)
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+def quantize(img, quality):
+    """Smallest palette PNG whose SSIM against img is at least quality.
+
+    Returns None if even 256 colors fall short.
+    """
+    import io
+
+    from PIL import Image
+
+    from .golden import ssim
+
+    rgba = img.convert('RGBA')
+    original = np.asarray(rgba)
+    for colors in PALETTE_SIZES:
+        candidate = rgba.quantize(colors, method=Image.Quantize.FASTOCTREE)
+        if ssim(original, np.asarray(candidate.convert('RGBA'))) >= quality:
+            buffer = io.BytesIO()
+            candidate.save(buffer, 'PNG', optimize=True)
+            return buffer.getvalue()
+    return None
+
+
+def optimize_screenshot(path, quality=None, max_dimension=None):
+    """Recompress one screenshot in memory.
+
+    Returns ``(report, data, hash_bits)``; ``data`` is None when the file
+    would not get smaller.
+    """
+    from PIL import Image
+
+    before = os.path.getsize(path)
+    start = time.perf_counter()
+    with Image.open(path) as img:
+        img.load()
+        bits = dhash_bits(img)
+        if max_dimension:
+            img = downscale(img, max_dimension)
+        data = encode_png(img, DEFAULT_SETTINGS)
+        if quality is not None:
+            lossy = quantize(img, quality)
+            if lossy is not None and len(lossy) < len(data):
+                data = lossy
+    seconds = time.perf_counter() - start
+    if len(data) >= before:
+        data = None
+    report = {'path': path, 'before': before,
+              'after': before if data is None else len(data), 'seconds': seconds}
+    return report, data, bits
+
+
+def out_path(path, out_dir):
+    """Where the copy of ``path`` goes under ``out_dir``, keeping its path
+    relative to the current directory.
+
+    Raises ValueError for a path that would land outside ``out_dir`` (an
+    absolute path or one with ``..`` that leaves the current directory) or
+    on the original itself, so a copy can never overwrite an original.
+    """
+    target = os.path.normpath(os.path.join(out_dir, os.path.relpath(os.path.abspath(path))))
+    root = os.path.abspath(out_dir)
+    if os.path.commonpath([root, os.path.abspath(target)]) != root:
+        raise ValueError(f"Cannot copy {path} into {out_dir}: it is outside the current directory")
+    if os.path.abspath(target) == os.path.abspath(path):
+        raise ValueError(f"Cannot copy {path} into {out_dir}: the copy would overwrite it")
+    return target
+
+
+def optimize_screenshots(paths, quality=None, max_dimension=None, out_dir=None,
+                         in_place=False, workers=None):
+    """Optimize screenshots on a thread pool and find near-duplicates.
+
+    Writes to ``out_dir`` (keeping paths relative to the current directory)
+    or over the originals with ``in_place``; otherwise only reports. Returns
+    ``(reports, duplicate_groups)``.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Resolve every copy up front so a bad path fails before anything is written
+    targets = {path: out_path(path, out_dir) for path in paths} if out_dir and not in_place else {}
+
+    def process(path):
+        report, data, bits = optimize_screenshot(path, quality, max_dimension)
+        target = path if in_place else targets.get(path)
+        if target and (data is not None or not in_place):
+            os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+            if data is None:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            with open(target, 'wb') as f:
+                f.write(data)
+        return report, bits
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(process, paths))
+    reports = [report for report, _ in results]
+    return reports, duplicate_groups(paths, [bits for _, bits in results])
@@ -0,0 +1,234 @@
+"""NumPy signed-distance-field rasterizer for the icon primitives.
+
+Every primitive produced by ``engine.layout`` is evaluated as a signed
+distance over the pixel grid inside its bounding box, and the distance is
+turned into analytic anti-aliased coverage (``clip(0.5 - d, 0, 1)``).
+Shapes are composited in paint order with premultiplied alpha; gradient
+paints are evaluated over the same window and multiplied by the coverage.
+
+Variants whose layouts have the same primitive sequence are rasterized
+together: the parameters of primitive ``k`` of every variant are stacked
+into arrays and broadcast over one shared pixel window, so a batch of
+designs costs one array pass per primitive instead of one per variant.
+
+The float canvas, the per-primitive color and source arrays and the
+conversion to 8-bit all work in the calling thread's scratch arena (see
+``arena.py``), so rendering one size after another reuses the same memory;
+only the returned uint8 pixels are newly allocated.
+"""
+
+import numpy as np
+
+from . import trace
+from .arena import local_arena
+from .display import stroke_segments
+from .paint import field, is_gradient
+
+
+def _primitives(ops):
+    """Convert layout ops to SDF primitives in pixel-center coordinates.
+
+    Pillow treats box coordinates as inclusive pixel indices, so an
+    ellipse box ``[x0, x1]`` covers ``x1 - x0 + 1`` pixels and its radius
+    grows by half a pixel. A stroke becomes one segment per polyline
+    segment, each carrying its own end styles: square ends extend the
+    segment by half the width, round ends add a half-width disc, so caps
+    and joins cost no extra primitives.
+    """
+    primitives = []
+    for op in ops:
+        if op[0] == 'ellipse':
+            x0, y0, x1, y1 = op[1]
+            radius = (x1 - x0) / 2 + 0.5
+            primitives.append(('disc', ((x0 + x1) / 2, (y0 + y1) / 2, radius), op[2], op[3]))
+            continue
+        half_width = op[2] / 2
+        for segment, paint, start, end in stroke_segments(op):
+            ends = (half_width if start == 'square' else 0.0, half_width if end == 'square' else 0.0,
+                    float(start == 'round'), float(end == 'round'))
+            primitives.append(('segment', tuple(segment) + (half_width,) + ends, paint, op[-1]))
+    return primitives
+
+
+def _kinds(ops):
+    """Primitive kind sequence of a layout, without building the primitives"""
+    kinds = []
+    for op in ops:
+        kinds += ['disc'] if op[0] == 'ellipse' else ['segment'] * len(op[1])
+    return tuple(kinds)
+
+
+def _bounds(kind, params):
+    """Pixel bounding box (x0, y0, x1, y1) of a primitive, one pixel padded"""
+    if kind == 'disc':
+        cx, cy, r = params
+        return cx - r - 1, cy - r - 1, cx + r + 1, cy + r + 1
+    x0, y0, x1, y1, half_width, extend_start, extend_end = params[:7]
+    pad = half_width + max(extend_start, extend_end) + 1
+    return min(x0, x1) - pad, min(y0, y1) - pad, max(x0, x1) + pad, max(y0, y1) + pad
+
+
+def disc_distance(px, py, cx, cy, radius):
+    return np.hypot(px - cx, py - cy) - radius
+
+
+def segment_distance(px, py, x0, y0, x1, y1, half_width,
+                     extend_start=0.0, extend_end=0.0, round_start=0.0, round_end=0.0):
+    """Distance to a thick line segment with butt, square or round ends.
+
+    The flat part runs from ``extend_start`` before the start to
+    ``extend_end`` past the end (half the width for square ends); where
+    ``round_start``/``round_end`` is set, a half-width disc is united on.
+    """
+    dx = x1 - x0
+    dy = y1 - y0
+    length = np.maximum(np.hypot(dx, dy), 1e-6)
+    ux = dx / length
+    uy = dy / length
+    rx = px - x0
+    ry = py - y0
+    middle = (length + extend_end - extend_start) / 2
+    along = np.abs(rx * ux + ry * uy - middle) - (length + extend_start + extend_end) / 2
+    across = np.abs(ry * ux - rx * uy) - half_width
+    outside = np.hypot(np.maximum(along, 0), np.maximum(across, 0))
+    inside = np.minimum(np.maximum(along, across), 0)
+    distance = outside + inside
+    if np.any(round_start):
+        distance = np.where(round_start > 0, np.minimum(distance, np.hypot(rx, ry) - half_width),
+                            distance)
+    if np.any(round_end):
+        distance = np.where(round_end > 0,
+                            np.minimum(distance, np.hypot(px - x1, py - y1) - half_width), distance)
+    return distance
+
+
+def coverage(distance, out=None):
+    """Analytic anti-aliasing: a one pixel wide ramp across the edge"""
+    return np.clip(np.subtract(0.5, distance, out=out), 0.0, 1.0, out=out)
+
+
+def _window(boxes, region):
+    """Pixel window covering all boxes, clipped to region (x0, y0, x1, y1)"""
+    x0 = max(int(np.floor(min(b[0] for b in boxes))), region[0])
+    y0 = max(int(np.floor(min(b[1] for b in boxes))), region[1])
+    x1 = min(int(np.ceil(max(b[2] for b in boxes))) + 1, region[2])
+    y1 = min(int(np.ceil(max(b[3] for b in boxes))) + 1, region[3])
+    return x0, y0, x1, y1
+
+
+def _composite(canvas, cov, colors):
+    """Paint premultiplied colors with coverage (N, h, w) over canvas.
+
+    ``colors`` is (N, 1, 1, 4) for flat paints or (N, h, w, 4) for gradients;
+    full-size colors are scratch and turned into the source in place.
+    ``cov`` is overwritten with the transmittance of the source.
+    """
+    out = colors if colors.shape == canvas.shape else local_arena().take('sdf.source', canvas.shape)
+    src = np.multiply(colors, cov[..., None], out=out)
+    np.subtract(1.0, src[..., 3], out=cov)
+    canvas *= cov[..., None]
+    canvas += src
+
+
+def _paints(batch, k, px, py):
+    """Premultiplied colors of primitive k of every layout over the window"""
+    paints = [primitives[k][2] for primitives in batch]
+    if any(is_gradient(p) for p in paints):
+        # Full-window colors go straight into the compositing source buffer
+        colors = local_arena().take('sdf.source', (len(paints), py.shape[1], px.shape[2], 4))
+    else:
+        colors = local_arena().take('sdf.paint', (len(paints), 1, 1, 4))
+    for paint, color in zip(paints, colors):
+        field(paint, px[0], py[0], out=color)
+    colors[..., :3] *= colors[..., 3:]
+    return colors
+
+
+def rasterize_batch(op_lists, size):
+    """Rasterize N layouts of one size into a premultiplied (N, H, W, 4) array.
+
+    All layouts must share the same primitive sequence. The array is an
+    arena view, valid until the next rasterization on this thread.
+    """
+    batch = [_primitives(ops) for ops in op_lists]
+    kinds = [[p[0] for p in primitives] for primitives in batch]
+    if any(k != kinds[0] for k in kinds):
+        raise ValueError("Layouts in one SDF batch must use the same primitive sequence")
+
+    canvas = local_arena().take('sdf.canvas', (len(batch), size, size, 4), zero=True)
+    for k, kind in enumerate(kinds[0]):
+        with trace.span(f"sdf.{batch[0][k][3]}", size=size, batch=len(batch)):
+            _rasterize_primitive(canvas, batch, k, kind, (0, 0, size, size))
+    return canvas
+
+
+def rasterize_region(ops, region):
+    """Rasterize the pixels in region (x0, y0, x1, y1) of one layout.
+
+    Returns a premultiplied (h, w, 4) arena view. Primitives are evaluated
+    from the geometry directly, so a region costs the same no matter how
+    large the full image is.
+    """
+    primitives = [_primitives(ops)]
+    x0, y0, x1, y1 = region
+    canvas = local_arena().take('sdf.canvas', (1, y1 - y0, x1 - x0, 4), zero=True)
+    for k, primitive in enumerate(primitives[0]):
+        _rasterize_primitive(canvas, primitives, k, primitive[0], region)
+    return canvas[0]
+
+
+def _rasterize_primitive(canvas, batch, k, kind, region):
+    """Evaluate primitive k of every layout and composite it.
+
+    ``canvas`` holds the pixels of ``region``; its top-left corner is
+    pixel (region[0], region[1]).
+    """
+    params = [primitives[k][1] for primitives in batch]
+    x0, y0, x1, y1 = _window([_bounds(kind, p) for p in params], region)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    px = np.arange(x0, x1, dtype=np.float32)[None, None, :]
+    py = np.arange(y0, y1, dtype=np.float32)[None, :, None]
+    columns = [np.asarray(c, dtype=np.float32)[:, None, None] for c in zip(*params)]
+    if kind == 'disc':
+        distance = disc_distance(px, py, *columns)
+    else:
+        distance = segment_distance(px, py, *columns)
+
+    ox, oy = region[:2]
+    _composite(canvas[:, y0 - oy:y1 - oy, x0 - ox:x1 - ox], coverage(distance, out=distance),
+               _paints(batch, k, px, py))
+
+
+def to_rgba8(canvas):
+    """Convert premultiplied float pixels to straight-alpha uint8 RGBA"""
+    # The compositing source buffer is free again once rasterization is done
+    straight = local_arena().take('sdf.source', canvas.shape)
+    straight[...] = canvas
+    # Fully transparent pixels are premultiplied zeros already
+    alpha = canvas[..., 3:]
+    np.divide(straight[..., :3], alpha, out=straight[..., :3], where=alpha > 0)
+    straight *= 255.0
+    straight += 0.5
+    np.clip(straight, 0, 255, out=straight)
+    return straight.astype(np.uint8)
+
+
+def render_layouts(op_lists, size):
+    """Rasterize layouts to uint8 RGBA arrays, batching compatible ones"""
+    groups = {}
+    for i, ops in enumerate(op_lists):
+        groups.setdefault(_kinds(ops), []).append(i)
+
+    pixels = np.zeros((len(op_lists), size, size, 4), dtype=np.uint8)
+    for indices in groups.values():
+        pixels[indices] = to_rgba8(rasterize_batch([op_lists[i] for i in indices], size))
+    return pixels
+
+
+def render_icon(ops, size):
+    """Rasterize one layout to an RGBA image"""
+    from PIL import Image
+
+    return Image.fromarray(render_layouts([ops], size)[0], 'RGBA')
@@ -0,0 +1,193 @@
+"""SVG export and rasterization of the vector master.
+
+``to_svg`` writes a design as SVG circles and lines (one line per stroke
+segment, with its cap style), replayed from the same display list the
+raster backends draw, so ``app_icon.svg`` is the vector master of the PNG
+icons. Coordinates follow the SDF backend's geometry: Pillow's inclusive
+ellipse boxes grow by half a pixel, and pixel ``i`` spans ``[i, i + 1]`` in
+SVG user units.
+
+Size-dependent rules (the minimum stroke width) are resolved at the master
+size, so the SVG is exact at SVG_SIZE and scales linearly from there.
+
+``rasterize`` renders a master at any size with cairosvg when it is
+installed, and otherwise parses the circles and lines back and rasterizes
+them with the NumPy SDF backend.
+"""
+
+import xml.etree.ElementTree as ET
+
+from .display import stroke_segments
+from .paint import is_gradient
+
+SVG_MASTER = 'app_icon.svg'
+SVG_SIZE = 512
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+
+def _hex(color):
+    return '#{:02X}{:02X}{:02X}'.format(*color[:3])
+
+
+def _num(value):
+    return f"{value:.3f}".rstrip('0').rstrip('.')
+
+
+def _paint(attribute, paint, gradient_id):
+    if is_gradient(paint):
+        return f'{attribute}="url(#{gradient_id})"'
+    opacity = f' {attribute}-opacity="{paint[3] / 255:g}"' if paint[3] != 255 else ''
+    return f'{attribute}="{_hex(paint)}"{opacity}'
+
+
+def _gradient(paint, gradient_id):
+    """<linearGradient>/<radialGradient> of a bound paint, in user space"""
+    kind, points, stops = paint
+    if kind == 'linear':
+        names = ('x1', 'y1', 'x2', 'y2')
+        values = [v + 0.5 for v in points]
+    else:
+        names = ('cx', 'cy', 'r')
+        values = [points[0] + 0.5, points[1] + 0.5, points[2]]
+    attributes = ' '.join(f'{n}="{_num(v)}"' for n, v in zip(names, values))
+    lines = [f'    <{kind}Gradient id="{gradient_id}" gradientUnits="userSpaceOnUse" {attributes}>']
+    for offset, color in stops:
+        opacity = f' stop-opacity="{color[3] / 255:g}"' if color[3] != 255 else ''
+        lines.append(f'      <stop offset="{_num(offset)}" stop-color="{_hex(color)}"{opacity}/>')
+    lines.append(f'    </{kind}Gradient>')
+    return lines
+
+
+def to_svg(design, size=SVG_SIZE):
+    """Return the SVG text of a design name, spec or display list"""
+    from .engine import layout
+
+    defs = []
+    body = []
+
+    def paint(attribute, value):
+        gradient_id = f"paint{len(defs)}"
+        if is_gradient(value):
+            defs.append(_gradient(value, gradient_id))
+        return _paint(attribute, value, gradient_id)
+
+    def circle(cx, cy, r, value):
+        body.append(f'  <circle cx="{_num(cx)}" cy="{_num(cy)}" r="{_num(r)}" {paint("fill", value)}/>')
+
+    for op in layout(design, size):
+        body.append(f'  <!-- {op[-1]} -->')
+        if op[0] == 'ellipse':
+            x0, y0, x1, y1 = op[1]
+            circle((x0 + x1) / 2 + 0.5, (y0 + y1) / 2 + 0.5, (x1 - x0) / 2 + 0.5, op[2])
+            continue
+
+        # One <line> per segment, painted in order so later segments
+        # overlap earlier ones; mixed end styles become a butt line with
+        # square ends extended and round ends as circles
+        half = op[2] / 2
+        for segment, value, start, end in stroke_segments(op):
+            x0, y0, x1, y1 = (v + 0.5 for v in segment)
+            cap = start if start == end else 'butt'
+            if cap == 'butt':
+                length = ((x1 - x0)**2 + (y1 - y0)**2)**0.5 or 1.0
+                ux, uy = (x1 - x0) / length * half, (y1 - y0) / length * half
+                if start == 'square':
+                    x0, y0 = x0 - ux, y0 - uy
+                if end == 'square':
+                    x1, y1 = x1 + ux, y1 + uy
+            linecap = f' stroke-linecap="{cap}"' if cap != 'butt' else ''
+            body.append(f'  <line x1="{_num(x0)}" y1="{_num(y0)}" x2="{_num(x1)}" y2="{_num(y1)}" '
+                        f'{paint("stroke", value)} stroke-width="{_num(op[2])}"{linecap}/>')
+            if cap == 'butt':
+                for (x, y), style in (((x0, y0), start), ((x1, y1), end)):
+                    if style == 'round':
+                        circle(x, y, half, value)
+
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg width="{size}" height="{size}" viewBox="0 0 {size} {size}" xmlns="{SVG_NS}">',
+    ]
+    if defs:
+        lines += ['  <defs>'] + [line for gradient in defs for line in gradient] + ['  </defs>']
+    lines += body + ['</svg>']
+    return '\n'.join(lines) + '\n'
+
+
+def write_svg(design, path=SVG_MASTER, size=SVG_SIZE):
+    with open(path, 'w') as f:
+        f.write(to_svg(design, size))
+    return path
+
+
+def _parse_color(value, opacity):
+    value = value.lstrip('#')
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4)) + (round(float(opacity) * 255),)
+
+
+def _parse_gradients(root, scale):
+    """Bound paints of every gradient in <defs>, by id, at the pixel scale"""
+    gradients = {}
+    for element in root.iter():
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag not in ('linearGradient', 'radialGradient'):
+            continue
+        stops = tuple((float(stop.get('offset')),
+                       _parse_color(stop.get('stop-color'), stop.get('stop-opacity', 1)))
+                      for stop in element)
+        if tag == 'linearGradient':
+            points = tuple(float(element.get(k)) * scale - 0.5 for k in ('x1', 'y1', 'x2', 'y2'))
+            gradients[element.get('id')] = ('linear', points, stops)
+        else:
+            cx, cy = (float(element.get(k)) * scale - 0.5 for k in ('cx', 'cy'))
+            gradients[element.get('id')] = ('radial', (cx, cy, float(element.get('r')) * scale), stops)
+    return gradients
+
+
+def _parse_paint(element, attribute, gradients):
+    value = element.get(attribute)
+    if value.startswith('url(#'):
+        return gradients[value[5:-1]]
+    return _parse_color(value, element.get(f"{attribute}-opacity", 1))
+
+
+def parse_ops(svg_text, size):
+    """Read the circles and lines of a master SVG as ops at a pixel size"""
+    root = ET.fromstring(svg_text)
+    viewbox = float(root.get('viewBox').split()[2])
+    scale = size / viewbox
+    gradients = _parse_gradients(root, scale)
+    ops = []
+    for element in root:
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag == 'circle':
+            cx, cy, r = (float(element.get(k)) * scale for k in ('cx', 'cy', 'r'))
+            # Back to inclusive pixel boxes, inverting to_svg
+            x0, y0 = cx - r, cy - r
+            x1, y1 = cx + r - 1, cy + r - 1
+            ops.append(('ellipse', (x0, y0, x1, y1), _parse_paint(element, 'fill', gradients), 'svg'))
+        elif tag == 'line':
+            coords = tuple(float(element.get(k)) * scale - 0.5 for k in ('x1', 'y1', 'x2', 'y2'))
+            width = float(element.get('stroke-width')) * scale
+            cap = element.get('stroke-linecap', 'butt')
+            ops.append(('stroke', (coords,), width, (_parse_paint(element, 'stroke', gradients),),
+                        cap, cap, 'svg'))
+    return ops
+
+
+def rasterize(svg_text, size):
+    """Rasterize master SVG text to an RGBA image of any size"""
+    from PIL import Image
+
+    try:
+        import cairosvg
+    except ImportError:
+        from . import sdf
+
+        return sdf.render_icon(parse_ops(svg_text, size), size)
+
+    import io
+
+    png = cairosvg.svg2png(bytestring=svg_text.encode('utf-8'),
+                           output_width=size, output_height=size)
+    return Image.open(io.BytesIO(png)).convert('RGBA')
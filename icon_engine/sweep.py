@@ -0,0 +1,235 @@
+"""Design parameter sweeps.
+
+A sweep takes a base design and a list of values for any number of spec
+fields, and renders every combination (the Cartesian product) at one size:
+
+    check_scale=0.4:0.8:0.1       start:stop:step, stop included
+    stroke_divisor=15,18,20       comma-separated values
+    caps=butt,round               names stay strings
+    stroke_colors=red/purple      '/' builds a tuple
+    check_points=[[...], [...]]   a JSON list, for nested fields
+
+Candidates are generated lazily and rendered in chunks on a process pool
+(the SDF backend rasterizes a chunk in one batched array pass), with at
+most ``IN_FLIGHT_PER_JOB`` chunks per worker queued. Results are consumed
+in order and streamed into paged contact sheets and a CSV index, so only
+the current page and the queued chunks are ever in memory, however many
+thousand candidates the product has.
+"""
+
+import csv
+import itertools
+import json
+import math
+import os
+import time
+
+from .batch import CELL_PADDING, LABEL_HEIGHT
+from .designs import get_design
+
+SWEEP_DIR = 'design-sweep'
+CHUNK_SIZE = 16
+IN_FLIGHT_PER_JOB = 2
+
+
+def _scalar(text):
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    if text == 'none':
+        return None
+    if '/' in text:
+        return tuple(_scalar(part) for part in text.split('/'))
+    return text
+
+
+def _tuples(value):
+    """JSON lists as the tuples design specs use"""
+    return tuple(_tuples(v) for v in value) if isinstance(value, list) else value
+
+
+def parse_values(text):
+    """Values of one swept field from its command line form"""
+    if text.startswith('['):
+        return [_tuples(value) for value in json.loads(text)]
+    parts = text.split(':')
+    if len(parts) == 3 and all(isinstance(_scalar(p), (int, float)) for p in parts):
+        start, stop, step = (_scalar(p) for p in parts)
+        if step <= 0:
+            raise ValueError(f"Range step must be positive: '{text}'")
+        count = math.floor((stop - start) / step + 1e-9) + 1
+        if count < 1:
+            raise ValueError(f"Range is empty: '{text}'")
+        if all(isinstance(v, int) for v in (start, stop, step)):
+            return [start + i * step for i in range(count)]
+        return [round(start + i * step, 10) for i in range(count)]
+    return [_scalar(part) for part in text.split(',')]
+
+
+def parse_params(items):
+    """``['field=values', ...]`` into a dict of field -> list of values"""
+    params = {}
+    for item in items:
+        field, sep, text = item.partition('=')
+        if not sep or not text:
+            raise ValueError(f"Expected FIELD=VALUES, got '{item}'")
+        try:
+            params[field.strip()] = parse_values(text.strip())
+        except ValueError as e:
+            raise ValueError(f"{field.strip()}: {e}") from None
+    return params
+
+
+def count_candidates(params):
+    return math.prod(len(values) for values in params.values())
+
+
+def check_params(base, params, size):
+    """Check field names and every single value before anything is rendered.
+
+    Each value is compiled into the base design on its own and replayed at
+    ``size``, so a typo or an impossible value (``stroke_divisor=0``) fails
+    up front with a ValueError naming it.
+    """
+    from .display import compile_design, replay
+
+    spec = get_design(base) if isinstance(base, str) else base
+    unknown = set(params) - set(spec)
+    if unknown:
+        raise ValueError(f"Unknown design fields: {', '.join(sorted(unknown))}")
+    for field, values in params.items():
+        for value in values:
+            try:
+                replay(compile_design(dict(spec, **{field: value})), size)
+            except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+                reason = e.args[0] if isinstance(e, KeyError) and e.args else e
+                raise ValueError(f"{field}={_label(value)}: {reason}") from None
+
+
+def candidates(base, params):
+    """Lazy ``(index, values, spec)`` over every combination of params"""
+    spec = get_design(base) if isinstance(base, str) else base
+    fields = list(params)
+    for index, values in enumerate(itertools.product(*params.values())):
+        yield index, values, dict(spec, **dict(zip(fields, values)))
+
+
+def render_chunk(specs, size, backend='sdf'):
+    """Render specs at one size into a uint8 (N, size, size, 4) array"""
+    from .batch import render_batch
+
+    return render_batch(specs, (size,), backend)[:, 0]
+
+
+def _rendered(chunks, size, backend, jobs):
+    """``(chunk, pixels)`` in candidate order, rendering ahead on a bounded pool"""
+    if jobs <= 1:
+        for chunk in chunks:
+            yield chunk, render_chunk([spec for _, _, spec in chunk], size, backend)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        queued = deque()
+        for chunk in chunks:
+            specs = [spec for _, _, spec in chunk]
+            queued.append((chunk, pool.submit(render_chunk, specs, size, backend)))
+            if len(queued) >= jobs * IN_FLIGHT_PER_JOB:
+                chunk, future = queued.popleft()
+                yield chunk, future.result()
+        while queued:
+            chunk, future = queued.popleft()
+            yield chunk, future.result()
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _label(value):
+    if isinstance(value, float):
+        return f"{value:g}"
+    if isinstance(value, tuple):
+        return '/'.join(_label(v) for v in value)
+    return str(value)
+
+
+class _SheetPages:
+    """Contact sheet pages of a fixed grid, saved as soon as they fill up"""
+
+    def __init__(self, out_dir, size, columns, rows):
+        self.out_dir = out_dir
+        self.size = size
+        self.columns = columns
+        self.rows = rows
+        self.cell_w = size + 2 * CELL_PADDING
+        self.cell_h = size + 2 * CELL_PADDING + 2 * LABEL_HEIGHT
+        self.paths = []
+        self._sheet = None
+        self._cells = 0
+
+    def add(self, pixels, lines):
+        """Place one candidate; returns ``(sheet path, row, column)``"""
+        from PIL import Image, ImageDraw
+
+        if self._sheet is None:
+            self._sheet = Image.new('RGBA', (self.columns * self.cell_w, self.rows * self.cell_h),
+                                    (255, 255, 255, 255))
+            self.paths.append(os.path.join(self.out_dir, f"sheet-{len(self.paths) + 1:04d}.png"))
+        row, column = divmod(self._cells, self.columns)
+        x = column * self.cell_w + CELL_PADDING
+        y = row * self.cell_h + CELL_PADDING
+        self._sheet.alpha_composite(Image.fromarray(pixels, 'RGBA'), (x, y))
+        draw = ImageDraw.Draw(self._sheet)
+        for i, line in enumerate(lines):
+            draw.text((x, y + self.size + 2 + i * LABEL_HEIGHT), line, fill=(33, 33, 33, 255))
+        self._cells += 1
+        if self._cells == self.columns * self.rows:
+            self.flush()
+        return self.paths[-1], row, column
+
+    def flush(self):
+        if self._sheet is not None:
+            # Trim the unused rows of a last, partly filled page
+            used_rows = -(-self._cells // self.columns)
+            page = self._sheet.crop((0, 0, self._sheet.width, used_rows * self.cell_h))
+            page.save(self.paths[-1], 'PNG')
+            self._sheet = None
+            self._cells = 0
+
+
+def run_sweep(base, params, size=128, out_dir=SWEEP_DIR, jobs=1, backend='sdf',
+              columns=8, rows=6):
+    """Render every combination of params onto paged sheets with a CSV index.
+
+    Writes ``sheet-NNNN.png`` pages and ``index.csv`` (candidate number,
+    sheet, row, column and the swept values) into ``out_dir``. Run
+    ``check_params`` first to reject bad values before anything is written.
+    Returns ``{count, sheets, index, seconds}``.
+    """
+    start = time.perf_counter()
+    combinations = candidates(base, params)
+    os.makedirs(out_dir, exist_ok=True)
+    fields = list(params)
+    pages = _SheetPages(out_dir, size, columns, rows)
+    index_path = os.path.join(out_dir, 'index.csv')
+    count = 0
+    with open(index_path, 'w', newline='') as f:
+        index = csv.writer(f)
+        index.writerow(['candidate', 'sheet', 'row', 'column'] + fields)
+        chunks = _chunks(combinations, CHUNK_SIZE)
+        for chunk, pixels in _rendered(chunks, size, backend, jobs):
+            for (number, values, _), icon in zip(chunk, pixels):
+                label = ' '.join(_label(v) for v in values)
+                path, row, column = pages.add(icon, [f"#{number}", label])
+                index.writerow([number, os.path.basename(path), row, column] + [_label(v) for v in values])
+                count += 1
+        pages.flush()
+    return {'count': count, 'sheets': pages.paths, 'index': index_path,
+            'seconds': time.perf_counter() - start}
@@ -0,0 +1,111 @@
+"""Optional per-operation profiling in Chrome ``trace_event`` format.
+
+Wrap work in ``with trace.span('name', key=value):``. While tracing is
+disabled ``span`` returns a shared no-op context manager, so instrumented
+code only pays for one function call and a flag check. When enabled, every
+span becomes a complete ("X") event tagged with the current context
+(variant and size) of its thread and can be written out as JSON for
+chrome://tracing or Perfetto. Worker processes collect their own events and
+hand them back to the parent with their results.
+"""
+
+import os
+import threading
+import time
+
+_enabled = False
+_events = []
+# Context tags per thread: a background writer encodes one output while
+# the main thread already renders the next
+_local = threading.local()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        _events.append({
+            'name': self.name,
+            'cat': self.name.split('.')[0],
+            'ph': 'X',
+            'ts': self.start / 1000,
+            'dur': (end - self.start) / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': dict(context(), **self.args),
+        })
+        return False
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def enable_worker():
+    """Process pool initializer: trace, dropping events inherited by fork"""
+    _events.clear()
+    enable()
+
+
+def is_enabled():
+    return _enabled
+
+
+def span(name, **args):
+    """Time a block as one trace event (a no-op unless tracing is enabled)"""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def set_context(**args):
+    """Tag every following event of this thread, e.g. variant and size"""
+    if _enabled:
+        _local.context = args
+
+
+def context():
+    """Context tags of the calling thread"""
+    return getattr(_local, 'context', {})
+
+
+def collect():
+    """Take the events recorded so far in this process"""
+    events = list(_events)
+    _events.clear()
+    return events
+
+
+def extend(events):
+    """Merge events recorded by a worker process"""
+    _events.extend(events)
+
+
+def write(path):
+    import json
+
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': collect(), 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,109 @@
+"""Watch a design spec file and re-render only the outputs it affects.
+
+The spec is a JSON file naming a ``base`` design plus any fields to
+override, e.g. ``{"base": "final_rounded", "check_scale": 0.8}``. The
+process stays alive between edits, so Pillow, NumPy and the mask and
+layer caches stay warm. After every save, each watched output's cache key
+is recomputed and only outputs whose key changed are rendered again; the
+latency from the file's modification time to the updated PNG is printed.
+"""
+
+import json
+import os
+import time
+
+from .build import ENCODER_SETTINGS, android_outputs, render_output
+from .cache import output_key
+from .designs import BASE_DESIGN, get_design
+from .display import compile_design, replay
+
+POLL_SECONDS = 0.02
+
+# Previews favour latency over size: fast deflate, no palette search
+PREVIEW_ENCODER = {
+    'compress_level': 1,
+    'strategies': ['default'],
+    'palette': False,
+    'strip_metadata': True,
+}
+
+
+def load_spec(path):
+    """Read a spec file into a full design dict"""
+    with open(path) as f:
+        data = json.load(f)
+    design = dict(get_design(data.pop('base', 'final_rounded')))
+    unknown = set(data) - set(BASE_DESIGN)
+    if unknown:
+        raise KeyError(f"Unknown design fields: {', '.join(sorted(unknown))}")
+    design.update(data)
+    return design
+
+
+def write_starter_spec(path, base='final_rounded'):
+    """Create a spec file listing every field of the base design"""
+    spec = dict(get_design(base), base=base)
+    with open(path, 'w') as f:
+        json.dump(spec, f, indent=2)
+        f.write('\n')
+
+
+def watch_outputs(preview_path, preview_size, include_android, base_path):
+    outputs = [{'name': 'preview', 'design': None, 'size': preview_size,
+                'paths': [preview_path], 'encoder': PREVIEW_ENCODER}]
+    if include_android:
+        outputs += android_outputs(None, base_path)
+    return outputs
+
+
+def watch(spec_path, preview_path='icon-preview.png', preview_size=512,
+          include_android=False, base_path=None, backend='pillow', iterations=None):
+    """Poll the spec and re-render stale outputs until interrupted"""
+    if not os.path.exists(spec_path):
+        write_starter_spec(spec_path)
+        print(f"📝 Wrote starter spec to {spec_path}")
+
+    outputs = watch_outputs(preview_path, preview_size, include_android,
+                            base_path or 'android/app/src/main/res')
+    keys = {}
+    last_mtime = None
+    print(f"👀 Watching {spec_path} (Ctrl+C to stop)")
+
+    try:
+        while iterations is None or iterations > 0:
+            mtime = os.stat(spec_path).st_mtime_ns
+            if mtime == last_mtime:
+                time.sleep(POLL_SECONDS)
+                continue
+            last_mtime = mtime
+
+            try:
+                design = load_spec(spec_path)
+                # Replaying is cheap and rejects values that parse but cannot
+                # be drawn (stroke_divisor 0, a string scale) before any render
+                replay(compile_design(design), preview_size)
+            except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+                # Typically a half-written file or a value mid-edit; wait for the next save
+                print(f"⚠️  {spec_path}: {e}")
+                continue
+
+            rendered = []
+            for output in outputs:
+                output['design'] = design
+                encoder = output.get('encoder', ENCODER_SETTINGS)
+                key = output_key(output, encoder=encoder, backend=backend)
+                if keys.get(output['name']) == key:
+                    continue
+                render_output(output, backend=backend, encoder=encoder)
+                keys[output['name']] = key
+                latency = (time.time_ns() - mtime) / 1e6
+                rendered.append(f"{output['name']} {latency:.0f} ms")
+
+            if rendered:
+                print(f"🔁 Updated after save: {', '.join(rendered)}")
+            else:
+                print("✔️  Saved, no output changed")
+            if iterations is not None:
+                iterations -= 1
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
@@ -0,0 +1,166 @@
+"""Atomic background writer for a whole output set.
+
+Outputs are encoded and written to temporary files next to their final
+paths (``.<name>.<token>.tmp``), and nothing in the tree changes until
+``commit`` renames every staged file into place with ``os.replace``. A run
+that fails or is interrupted before the commit removes its temporary files
+and leaves the existing icons untouched, instead of a mix of old and new
+densities. The commit itself first moves the existing files aside
+(``.<name>.<token>.bak``) and moves them back if any rename fails.
+
+Rendered images handed to ``submit`` are encoded on a background thread
+behind a bounded queue, so the next output renders while the previous one
+is compressed and written. Worker processes stage their own files with
+``stage_images`` and hand the reports over with ``add``.
+"""
+
+import os
+import queue
+import secrets
+import threading
+
+
+def temp_path(path, token):
+    folder, name = os.path.split(path)
+    return os.path.join(folder, f".{name}.{token}.tmp")
+
+
+def backup_path(path, token):
+    folder, name = os.path.split(path)
+    return os.path.join(folder, f".{name}.{token}.bak")
+
+
+def stage_images(groups, encoder, token=None):
+    """Encode ``[(paths, image)]`` groups once per distinct image and write them.
+
+    With a ``token`` the files go to temporary paths, recorded as ``temp``
+    in each report; without one they are written in place. Paths that
+    share pixels share one encode and are copied.
+    """
+    import shutil
+
+    from .encode import encode_to_file
+
+    reports = []
+    written = []  # (image, first file, report) of every encoded image
+    for paths, image in groups:
+        source = next((w for w in written if w[0].tobytes() == image.tobytes()), None)
+        if source is None:
+            target = temp_path(paths[0], token) if token else paths[0]
+            report = dict(encode_to_file(image, target, encoder), path=paths[0])
+            if token:
+                report['temp'] = target
+            source = (image, target, report)
+            written.append(source)
+            reports.append(report)
+            paths = paths[1:]
+        for path in paths:
+            target = temp_path(path, token) if token else path
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            shutil.copyfile(source[1], target)
+            report = dict(source[2], path=path, seconds=0.0)
+            if token:
+                report['temp'] = target
+            reports.append(report)
+    return reports
+
+
+class AtomicWriter:
+    """Stage outputs in the background and commit them all at once"""
+
+    def __init__(self, encoder=None, max_pending=4):
+        self.encoder = encoder
+        self.token = f"{os.getpid()}-{secrets.token_hex(4)}"
+        self.staged = []
+        self._queue = queue.Queue(max_pending)
+        self._thread = None
+        self._error = None
+
+    def _run(self):
+        from . import trace
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error is not None:
+                continue
+            groups, context = item
+            trace.set_context(**context)
+            try:
+                self.staged.extend(stage_images(groups, self.encoder, self.token))
+            except BaseException as e:
+                self._error = e
+
+    def submit(self, groups, context=None):
+        """Queue rendered ``[(paths, image)]`` groups; blocks while the queue is full.
+
+        ``context`` holds the trace tags of the output, since the writer
+        thread encodes it after the caller has moved on to the next one.
+        """
+        if self._error is not None:
+            raise self._error
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='icon-writer', daemon=True)
+            self._thread.start()
+        self._queue.put((groups, context or {}))
+
+    def add(self, reports):
+        """Record files a worker process already staged"""
+        self.staged.extend(reports)
+
+    def _drain(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def commit(self):
+        """Wait for pending writes, then move every staged file into place.
+
+        Either every file is replaced or, if a rename fails, the previous
+        files are restored and the error is raised; the staged files are
+        then still there for ``abort`` to remove.
+        """
+        self._drain()
+        if self._error is not None:
+            raise self._error
+        backups = {}  # path -> backup of the file it replaces
+        replaced = []
+        try:
+            for report in self.staged:
+                path = report['path']
+                if path not in backups and os.path.exists(path):
+                    backups[path] = backup_path(path, self.token)
+                    os.replace(path, backups[path])
+            for report in self.staged:
+                os.replace(report['temp'], report['path'])
+                replaced.append(report['path'])
+        except BaseException:
+            self._rollback(backups, replaced)
+            raise
+        for backup in backups.values():
+            os.remove(backup)
+        committed = [{key: value for key, value in report.items() if key != 'temp'}
+                     for report in self.staged]
+        self.staged = []
+        return committed
+
+    def _rollback(self, backups, replaced):
+        """Put back the files a failed commit moved aside or created"""
+        for path in replaced:
+            if path not in backups and os.path.exists(path):
+                os.remove(path)
+        for path, backup in backups.items():
+            if os.path.exists(backup):
+                os.replace(backup, path)
+
+    def abort(self, paths=()):
+        """Drop staged files, including any a worker wrote for ``paths`` before it stopped"""
+        self._drain()
+        temps = {report['temp'] for report in self.staged}
+        temps.update(temp_path(path, self.token) for path in paths)
+        for temp in temps:
+            if os.path.exists(temp):
+                os.remove(temp)
+        self.staged = []
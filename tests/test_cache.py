@@ -0,0 +1,45 @@
+"""Build cache keys follow the colors a design resolves to, not its names."""
+
+from icon_engine import designs
+from icon_engine.cache import BuildCache, output_key
+
+
+def _output(layer=None):
+    # A spec dict is compiled on every call, so palette edits are picked up
+    return {'name': 'test', 'design': dict(designs.get_design('final_rounded')), 'size': 48,
+            'paths': ['test.png'], 'layer': layer}
+
+
+def test_key_changes_with_palette_color(monkeypatch):
+    before = output_key(_output())
+    monkeypatch.setitem(designs.PALETTE, 'green', (0, 0, 0, 255))
+    assert output_key(_output()) != before
+
+
+def test_key_ignores_unused_palette_color(monkeypatch):
+    before = output_key(_output())
+    monkeypatch.setitem(designs.PALETTE, 'orange', (0, 0, 0, 255))
+    assert output_key(_output()) == before
+
+
+def test_palette_change_makes_output_stale(tmp_path, monkeypatch):
+    output = _output()
+    output['paths'] = [str(tmp_path / 'icon.png')]
+    (tmp_path / 'icon.png').write_bytes(b'png')
+    cache = BuildCache(str(tmp_path / 'manifest.json'))
+    cache.partition([output])
+    cache.record(output)
+
+    assert cache.partition([_output() | {'paths': output['paths']}])[1]
+    monkeypatch.setitem(designs.PALETTE, 'green', (0, 0, 0, 255))
+    stale, fresh = cache.partition([_output() | {'paths': output['paths']}])
+    assert stale and not fresh
+
+
+def test_background_layer_key_follows_gradient_stops(monkeypatch):
+    output = _output('background')
+    output['design']['background'] = 'green_gradient'
+    before = output_key(output)
+    gradient = dict(designs.GRADIENTS['green_gradient'], stops=('green', 'white'))
+    monkeypatch.setitem(designs.GRADIENTS, 'green_gradient', gradient)
+    assert output_key(output) != before
@@ -0,0 +1,42 @@
+"""Each build command picks its own default targets."""
+
+import pytest
+
+from icon_engine import build
+from icon_engine.build import COMMITTED_TARGETS, TARGETS
+from icon_engine.cli import build_parser, main
+
+
+class _Planned(Exception):
+    pass
+
+
+@pytest.mark.parametrize('command, expected', [
+    ('plan', TARGETS),
+    ('render', TARGETS),
+    ('verify', COMMITTED_TARGETS),
+])
+def test_default_targets(monkeypatch, command, expected):
+    def plan_outputs(design, targets):
+        raise _Planned(targets)
+
+    monkeypatch.setattr(build, 'plan_outputs', plan_outputs)
+    with pytest.raises(_Planned) as planned:
+        main([command])
+    assert planned.value.args[0] == expected
+
+
+def test_explicit_targets_win(monkeypatch):
+    def plan_outputs(design, targets):
+        raise _Planned(targets)
+
+    monkeypatch.setattr(build, 'plan_outputs', plan_outputs)
+    with pytest.raises(_Planned) as planned:
+        main(['verify', '--targets', 'ios'])
+    assert planned.value.args[0] == ('ios',)
+
+
+def test_parser_leaves_targets_unset():
+    parser = build_parser()
+    for command in ('plan', 'render', 'verify'):
+        assert parser.parse_args([command]).targets is None
@@ -0,0 +1,46 @@
+"""Palette reduction and the encode stage never change a pixel."""
+
+import io
+
+import numpy as np
+from PIL import Image
+
+from icon_engine.encode import DEFAULT_SETTINGS, encode_png, to_palette
+from icon_engine.engine import render_icon
+
+
+def _rgba(img):
+    return np.asarray(img.convert('RGBA'))
+
+
+def _decoded(data):
+    with Image.open(io.BytesIO(data)) as img:
+        return _rgba(img)
+
+
+def test_palette_is_lossless_with_partial_transparency():
+    pixels = np.zeros((16, 16, 4), dtype=np.uint8)
+    pixels[:8] = (76, 175, 80, 255)
+    pixels[8:, :8] = (244, 67, 54, 128)
+    pixels[8:, 8:] = (0, 0, 0, 0)
+    img = Image.fromarray(pixels, 'RGBA')
+
+    palette_img = to_palette(img)
+    assert palette_img.mode == 'P'
+    assert np.array_equal(_rgba(palette_img), pixels)
+    buffer = io.BytesIO()
+    palette_img.save(buffer, 'PNG')
+    assert np.array_equal(_decoded(buffer.getvalue()), pixels)
+
+
+def test_palette_gives_up_above_256_colors():
+    ramp = np.arange(17 * 17, dtype=np.uint32).reshape(17, 17)
+    pixels = np.stack([ramp % 256, ramp // 256, np.zeros_like(ramp), np.full_like(ramp, 255)],
+                      axis=-1)
+    assert to_palette(Image.fromarray(pixels.astype(np.uint8), 'RGBA')) is None
+
+
+def test_encoded_icons_decode_to_the_same_pixels():
+    for backend in ('pillow', 'sdf'):
+        icon = render_icon('gradient', 96, backend)
+        assert np.array_equal(_decoded(encode_png(icon, DEFAULT_SETTINGS)), _rgba(icon))
@@ -0,0 +1,20 @@
+"""Listing assets are written as truecolor PNGs the Play Store accepts."""
+
+import os
+
+from PIL import Image
+
+from icon_engine.listing import build_listing
+
+
+def test_listing_modes(tmp_path):
+    shot = tmp_path / 'screenshot1.png'
+    Image.new('RGB', (360, 720), (250, 250, 250)).save(shot)
+    out_dir = tmp_path / 'play-store'
+    reports, _ = build_listing(screenshots=[str(shot)], out_dir=str(out_dir))
+    modes = {os.path.relpath(r['path'], out_dir): Image.open(r['path']).mode for r in reports}
+    assert modes == {
+        'icon-512.png': 'RGBA',
+        'feature-graphic-1024x500.png': 'RGB',
+        os.path.join('screenshots', 'phone-1-screenshot1.png'): 'RGB',
+    }
@@ -0,0 +1,42 @@
+"""Copies written with --out stay inside the output directory."""
+
+import os
+
+import pytest
+from PIL import Image
+
+from icon_engine.screenshots import optimize_screenshots, out_path
+
+
+def _screenshot(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new('RGB', (40, 90), (9, 9, 9)).save(path)
+    return path
+
+
+def test_copies_keep_relative_paths(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _screenshot(tmp_path / 'sub' / 'a.png')
+    before = (tmp_path / 'sub' / 'a.png').read_bytes()
+    optimize_screenshots(['sub/a.png'], max_dimension=20, out_dir='out')
+    assert Image.open(tmp_path / 'out' / 'sub' / 'a.png').size == (9, 20)
+    assert (tmp_path / 'sub' / 'a.png').read_bytes() == before
+
+
+@pytest.mark.parametrize('path', ['../outside.png', 'sub/../../outside.png', None])
+def test_paths_outside_the_current_directory_are_refused(tmp_path, monkeypatch, path):
+    cwd = tmp_path / 'cwd'
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    source = _screenshot(tmp_path / 'outside.png')
+    before = source.read_bytes()
+    with pytest.raises(ValueError):
+        optimize_screenshots([path or str(source)], max_dimension=20, out_dir=str(tmp_path / 'out'))
+    assert source.read_bytes() == before
+    assert not os.path.exists(tmp_path / 'out')
+
+
+def test_copy_onto_the_original_is_refused(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError):
+        out_path('a.png', '.')
@@ -0,0 +1,22 @@
+"""check_params rejects every value that cannot be rendered, up front."""
+
+import pytest
+
+from icon_engine.sweep import check_params, parse_params
+
+
+@pytest.mark.parametrize('item, message', [
+    ('caps=wavy', "Unknown caps style 'wavy'"),
+    ('join=wavy', "Unknown join style 'wavy'"),
+    ('dot_colors=red', 'takes a tuple of colors'),
+    ('stroke_divisor=0', 'stroke_divisor=0'),
+    ('bogus=1', 'Unknown design fields: bogus'),
+])
+def test_bad_values_are_rejected(item, message):
+    with pytest.raises(ValueError, match=message):
+        check_params('final_rounded', parse_params([item]), 64)
+
+
+def test_good_values_pass():
+    params = parse_params(['caps=butt,round,square', 'join=round', 'dot_colors=red/purple/green'])
+    check_params('final_rounded', params, 64)
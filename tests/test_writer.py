@@ -0,0 +1,90 @@
+"""AtomicWriter leaves the tree untouched unless the whole run commits."""
+
+import os
+
+import pytest
+from PIL import Image
+
+from icon_engine import writer
+from icon_engine.writer import AtomicWriter, stage_images, temp_path
+
+
+def _groups(tmp_path, names, color=(255, 0, 0, 255)):
+    image = Image.new('RGBA', (8, 8), color)
+    return [([str(tmp_path / name)], image) for name in names]
+
+
+def _files(tmp_path):
+    return sorted(os.listdir(tmp_path))
+
+
+def test_commit_moves_staged_files_into_place(tmp_path):
+    atomic = AtomicWriter()
+    atomic.submit(_groups(tmp_path, ['a.png', 'b.png']))
+    reports = atomic.commit()
+    assert _files(tmp_path) == ['a.png', 'b.png']
+    assert all('temp' not in report for report in reports)
+
+
+def test_abort_removes_staged_files_and_keeps_existing_ones(tmp_path):
+    (tmp_path / 'a.png').write_bytes(b'old')
+    atomic = AtomicWriter()
+    atomic.submit(_groups(tmp_path, ['a.png', 'b.png']))
+    atomic.abort()
+    assert _files(tmp_path) == ['a.png']
+    assert (tmp_path / 'a.png').read_bytes() == b'old'
+
+
+def test_abort_removes_files_a_worker_staged(tmp_path):
+    atomic = AtomicWriter()
+    # A worker process stages with the token but dies before handing reports over
+    stage_images(_groups(tmp_path, ['a.png']), None, atomic.token)
+    assert _files(tmp_path) == [os.path.basename(temp_path('a.png', atomic.token))]
+    atomic.abort([str(tmp_path / 'a.png')])
+    assert _files(tmp_path) == []
+
+
+def test_failed_commit_restores_the_previous_files(tmp_path, monkeypatch):
+    (tmp_path / 'a.png').write_bytes(b'old a')
+    (tmp_path / 'c.png').write_bytes(b'old c')
+    atomic = AtomicWriter()
+    atomic.submit(_groups(tmp_path, ['a.png', 'b.png', 'c.png']))
+    replace = os.replace
+    renames = []
+
+    def failing_replace(source, target):
+        if source.endswith('.tmp'):
+            renames.append(target)
+            if len(renames) == 2:
+                raise OSError('disk full')
+        replace(source, target)
+
+    monkeypatch.setattr(writer.os, 'replace', failing_replace)
+    with pytest.raises(OSError, match='disk full'):
+        atomic.commit()
+    # a.png was already replaced when b.png failed; it is back to the old file
+    assert (tmp_path / 'a.png').read_bytes() == b'old a'
+    assert (tmp_path / 'c.png').read_bytes() == b'old c'
+    assert not (tmp_path / 'b.png').exists()
+    atomic.abort()
+    assert _files(tmp_path) == ['a.png', 'c.png']
+
+
+def test_commit_removes_backups(tmp_path):
+    (tmp_path / 'a.png').write_bytes(b'old')
+    atomic = AtomicWriter()
+    atomic.submit(_groups(tmp_path, ['a.png']))
+    atomic.commit()
+    assert _files(tmp_path) == ['a.png']
+    assert (tmp_path / 'a.png').read_bytes() != b'old'
+
+
+def test_encode_error_surfaces_on_commit(tmp_path, monkeypatch):
+    def broken(*args):
+        raise RuntimeError('encoder failed')
+
+    monkeypatch.setattr(writer, 'stage_images', broken)
+    atomic = AtomicWriter()
+    atomic.submit(_groups(tmp_path, ['a.png']))
+    with pytest.raises(RuntimeError, match='encoder failed'):
+        atomic.commit()